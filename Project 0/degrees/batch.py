@@ -0,0 +1,133 @@
+import csv
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+from nameindex import NameIndex
+from snapshot import load_graph
+
+# Graph used by each worker process, mapped once per process
+graph = None
+
+# How to choose between several people who share a name
+POLICY = "most_films"
+
+
+def main():
+    if len(sys.argv) < 2 or len(sys.argv) > 4:
+        sys.exit("Usage: python batch.py queries.csv [directory] [workers]")
+    queries = sys.argv[1]
+    directory = sys.argv[2] if len(sys.argv) >= 3 else "large"
+    workers = int(sys.argv[3]) if len(sys.argv) == 4 else os.cpu_count()
+
+    # Build the snapshot up front so workers only need to map it
+    start = time.perf_counter()
+    init_worker(directory)
+    pairs = read_pairs(queries)
+    groups, errors = group_queries(pairs)
+    for error in errors:
+        write_result(error)
+
+    answered = 0
+    with Pool(workers, initializer=init_worker, initargs=(directory,)) as pool:
+        for results in pool.imap_unordered(answer_group, groups):
+            for result in results:
+                write_result(result)
+            answered += len(results)
+
+    elapsed = time.perf_counter() - start
+    total = answered + len(errors)
+    print(f"{total} queries from {len(groups)} sources "
+          f"in {elapsed:.2f}s ({total / elapsed:.1f} queries/s)",
+          file=sys.stderr)
+
+
+def init_worker(directory):
+    """
+    Maps the graph for directory into this process.
+    """
+    global graph
+    graph = load_graph(directory)
+
+
+def read_pairs(filename):
+    """
+    Returns (source name, target name) pairs from a CSV file
+    with one pair of names per row.
+    """
+    pairs = []
+    with open(filename, encoding="utf-8", newline="") as f:
+        for row in csv.reader(f):
+            if len(row) >= 2:
+                pairs.append((row[0].strip(), row[1].strip()))
+    return pairs
+
+
+def group_queries(pairs):
+    """
+    Resolves every name and groups queries by source person, so one
+    search from each source answers all of its targets.
+    Returns a list of (source, [(source name, target name, target)])
+    groups and a list of error results for unresolved names.
+    """
+    groups = {}
+    errors = []
+    for source_name, target_name in pairs:
+        source, error = resolve(source_name)
+        if error is None:
+            target, error = resolve(target_name)
+        if error is not None:
+            errors.append({"source": source_name, "target": target_name,
+                           "error": error})
+            continue
+        groups.setdefault(source, []).append((source_name, target_name, target))
+    return list(groups.items()), errors
+
+
+def resolve(name):
+    """
+    Returns (person index, None) for a name, or (None, error message)
+    if no name matches, even allowing for typos. Shared names are
+    resolved by POLICY rather than by asking.
+    """
+    person_id = NameIndex(graph).resolve(name, policy=POLICY)
+    if person_id is None:
+        return None, f"person not found: {name}"
+    return graph.person_index(person_id), None
+
+
+def answer_group(group):
+    """
+    Answers every query in a group from one breadth-first search.
+    """
+    source, queries = group
+    paths = graph.paths_from(source, [target for _, _, target in queries],
+                             graph.landmark_index)
+    results = []
+    for source_name, target_name, target in queries:
+        path = paths[target]
+        result = {"source": source_name, "target": target_name,
+                  "source_id": graph.person_ids[source],
+                  "target_id": graph.person_ids[target]}
+        if path is None:
+            result["degrees"] = None
+            result["path"] = None
+        else:
+            result["degrees"] = len(path)
+            result["path"] = [[graph.movie_ids[movie], graph.person_ids[person]]
+                              for movie, person in path]
+        results.append(result)
+    return results
+
+
+def write_result(result):
+    """
+    Writes one result as a line of JSON.
+    """
+    sys.stdout.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+import random
+import sys
+import time
+import tracemalloc
+
+import degrees
+from graph import Graph
+from nameindex import NameIndex
+from snapshot import load_graph, open_snapshot, snapshot_path
+from util import Node, StackFrontier, QueueFrontier
+
+
+class ListStackFrontier():
+    """
+    The original list-backed stack frontier, kept for comparison.
+    """
+
+    def __init__(self):
+        self.frontier = []
+
+    def add(self, node):
+        self.frontier.append(node)
+
+    def contains_state(self, state):
+        return any(node.state == state for node in self.frontier)
+
+    def empty(self):
+        return len(self.frontier) == 0
+
+    def remove(self):
+        if self.empty():
+            raise Exception("empty frontier")
+        else:
+            node = self.frontier[-1]
+            self.frontier = self.frontier[:-1]
+            return node
+
+
+class ListQueueFrontier(ListStackFrontier):
+
+    def remove(self):
+        if self.empty():
+            raise Exception("empty frontier")
+        else:
+            node = self.frontier[0]
+            self.frontier = self.frontier[1:]
+            return node
+
+
+def set_shortest_path(source, target):
+    """
+    The original search, which builds every expanded person's
+    full neighbor set, kept for comparison.
+    """
+    strt = Node(state=source, parent=None, action=None)
+    que = QueueFrontier()
+    que.add(strt)
+
+    visited = set()
+    while True:
+        if que.empty():
+            return None
+        node = que.remove()
+        person_id = node.state
+        if person_id in visited:
+            continue
+
+        visited.add(person_id)
+
+        neighbors = degrees.neighbors_for_person(person_id)
+        for neighbor in neighbors:
+            movie_id = neighbor[0]
+            person_id = neighbor[1]
+            if person_id not in visited:
+                if person_id == target:
+                    path = [(movie_id, person_id)]
+                    previous = node
+                    while previous.parent is not None:
+                        path.append((previous.action, previous.state))
+                        previous = previous.parent
+                    path.reverse()
+                    return path
+                else:
+                    new_node = Node(state=person_id, parent=node, action=movie_id)
+                    que.add(new_node)
+
+
+def time_search(search, pairs):
+    """
+    Runs search on every (source, target) pair and returns
+    the total elapsed time and the list of path lengths.
+    """
+    lengths = []
+    start = time.perf_counter()
+    for source, target in pairs:
+        path = search(source, target)
+        lengths.append(None if path is None else len(path))
+    return time.perf_counter() - start, lengths
+
+
+def benchmark_search(directory, count=100, seed=0):
+    """
+    Compares single-ended and bidirectional search on random person pairs.
+    """
+    degrees.load_data(directory)
+    rng = random.Random(seed)
+    person_ids = sorted(
+        person_id for person_id, person in degrees.people.items()
+        if person["movies"]
+    )
+    pairs = [tuple(rng.sample(person_ids, 2)) for _ in range(count)]
+
+    # The searches must also agree when source and target are the same
+    pairs += [(person_id, person_id) for person_id in person_ids[:3]]
+
+    single, single_lengths = time_search(degrees.shortest_path, pairs)
+    both, both_lengths = time_search(degrees.bidirectional_shortest_path, pairs)
+    if single_lengths != both_lengths:
+        sys.exit("Searches disagree on path lengths.")
+
+    print(f"{count} random pairs from {directory}")
+    print(f"    shortest_path:               {single:.3f}s")
+    print(f"    bidirectional_shortest_path: {both:.3f}s")
+    print(f"    speedup: {single / both:.1f}x")
+
+
+def time_frontier(frontier_class, size, operations):
+    """
+    Fills a frontier with size nodes, then returns the average time
+    in microseconds of a contains_state check and of a remove.
+    """
+    frontier = frontier_class()
+    for state in range(size):
+        frontier.add(Node(state=state, parent=None, action=None))
+
+    start = time.perf_counter()
+    for state in range(operations):
+        frontier.contains_state(size - state - 1)
+    contains = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(operations):
+        frontier.remove()
+    remove = time.perf_counter() - start
+
+    return contains / operations * 1e6, remove / operations * 1e6
+
+
+def benchmark_frontiers(sizes=(10 ** 5, 3 * 10 ** 5, 10 ** 6), operations=100):
+    """
+    Compares per-operation cost of list-backed and deque-backed frontiers
+    as the number of queued nodes grows.
+    """
+    frontiers = [
+        ("ListStackFrontier", ListStackFrontier),
+        ("ListQueueFrontier", ListQueueFrontier),
+        ("StackFrontier", StackFrontier),
+        ("QueueFrontier", QueueFrontier),
+    ]
+    print(f"{'frontier':<20}{'nodes':>10}{'contains us':>14}{'remove us':>12}")
+    for name, frontier_class in frontiers:
+        for size in sizes:
+            contains, remove = time_frontier(frontier_class, size, operations)
+            print(f"{name:<20}{size:>10}{contains:>14.2f}{remove:>12.2f}")
+
+
+def trace_search(search, pairs):
+    """
+    Runs search on every pair under tracemalloc and returns the
+    mean peak traced memory per query in KiB and the total time.
+    """
+    peaks = 0
+    start = time.perf_counter()
+    for source, target in pairs:
+        tracemalloc.start()
+        search(source, target)
+        peaks += tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return peaks / len(pairs) / 1024, time.perf_counter() - start
+
+
+def benchmark_neighbors(directory, count=100, seed=0):
+    """
+    Compares per-query peak allocation of the original set-building
+    search with the search over streamed neighbors.
+    """
+    degrees.load_data(directory)
+    rng = random.Random(seed)
+    person_ids = sorted(
+        person_id for person_id, person in degrees.people.items()
+        if person["movies"]
+    )
+    pairs = [tuple(rng.sample(person_ids, 2)) for _ in range(count)]
+
+    print(f"{count} random pairs from {directory}")
+    for name, search in [("neighbor sets", set_shortest_path),
+                         ("streamed neighbors", degrees.shortest_path)]:
+        peak, elapsed = trace_search(search, pairs)
+        print(f"    {name:<20}{peak:10.1f} KiB peak/query  {elapsed:.2f}s")
+
+
+def benchmark_memory(directory):
+    """
+    Compares memory held by load_data's dicts of sets
+    with memory held by the compact Graph store.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    degrees.load_data(directory)
+    dict_time = time.perf_counter() - start
+    dict_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    graph = Graph.load(directory)
+    graph_time = time.perf_counter() - start
+    graph_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Data from {directory}")
+    print(f"    load_data:  {dict_memory / 2 ** 20:8.1f} MiB  {dict_time:.2f}s")
+    print(f"    Graph.load: {graph_memory / 2 ** 20:8.1f} MiB  {graph_time:.2f}s")
+    print(f"    saving: {1 - graph_memory / dict_memory:.0%}")
+
+
+def benchmark_startup(directory):
+    """
+    Compares time to first query when parsing the CSV files
+    with time to map an up-to-date snapshot.
+    """
+    start = time.perf_counter()
+    degrees.load_data(directory)
+    dict_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    Graph.load(directory)
+    parse_time = time.perf_counter() - start
+
+    load_graph(directory)
+    start = time.perf_counter()
+    graph = open_snapshot(snapshot_path(directory), directory)
+    map_time = time.perf_counter() - start
+    if graph is None:
+        sys.exit("Could not write a snapshot.")
+
+    print(f"Startup on {directory}")
+    print(f"    load_data:     {dict_time * 1000:10.1f}ms")
+    print(f"    Graph.load:    {parse_time * 1000:10.1f}ms")
+    print(f"    open_snapshot: {map_time * 1000:10.1f}ms")
+
+
+def benchmark_landmarks(directory, count=100, seed=0):
+    """
+    Checks searches bounded by the snapshot's landmark distances
+    against plain breadth-first search on random pairs, with and
+    without max_degrees, and compares their times.
+    """
+    graph = load_graph(directory)
+    rng = random.Random(seed)
+    people = [person for person in range(len(graph.person_ids))
+              if len(graph.movies_for(person))]
+    pairs = [(rng.choice(people), rng.choice(people)) for _ in range(count)]
+
+    # Plain breadth-first search from each source gives the distances
+    start = time.perf_counter()
+    lengths = []
+    for source, target in pairs:
+        path = graph.paths_from(source, [target])[target]
+        lengths.append(None if path is None else len(path))
+    plain_time = time.perf_counter() - start
+
+    landmarks = graph.landmark_index
+    print(f"{count} random pairs from {directory}, "
+          f"{lengths.count(None)} not connected, "
+          f"{len(graph.landmarks)} landmarks")
+    print(f"{'search':<24}{'max degrees':>12}{'unpruned s':>12}"
+          f"{'pruned s':>10}{'speedup':>9}")
+    for max_degrees in (None, 2, 4):
+        expected = []
+        for (source, target), length in zip(pairs, lengths):
+            if source == target:
+                length = 0
+            elif length is not None and max_degrees is not None and \
+                    length > max_degrees:
+                length = None
+            expected.append(length)
+
+        def search(bounds):
+            for (source, target), length in zip(pairs, expected):
+                path = graph.shortest_index_path(source, target,
+                                                 max_degrees, bounds)
+                if (None if path is None else len(path)) != length:
+                    sys.exit(f"Searches disagree on {source}, {target}.")
+
+        unpruned, pruned = best_time(search, None), best_time(search,
+                                                              landmarks)
+        limit = "" if max_degrees is None else max_degrees
+        print(f"{'shortest_index_path':<24}{limit:>12}{unpruned:>12.3f}"
+              f"{pruned:>10.3f}{unpruned / pruned:>8.1f}x")
+
+    # Groups of a few targets from one source, as batch.py answers them
+    groups = [(pairs[i][0], [target for _, target in pairs[i:i + 3]])
+              for i in range(0, count, 3)]
+    expected = [graph.paths_from(source, targets)
+                for source, targets in groups]
+
+    def batch(bounds):
+        for (source, targets), paths in zip(groups, expected):
+            if graph.paths_from(source, targets, bounds) != paths:
+                sys.exit(f"Batched searches disagree from {source}.")
+
+    unpruned, pruned = best_time(batch, None), best_time(batch, landmarks)
+    print(f"{'paths_from':<24}{'':>12}{unpruned:>12.3f}"
+          f"{pruned:>10.3f}{unpruned / pruned:>8.1f}x")
+    print(f"    plain BFS for the reference lengths: {plain_time:.3f}s")
+
+
+def best_time(run, *args, repeat=3):
+    """
+    Returns the shortest time of repeat calls of run(*args).
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def with_typo(name, rng):
+    """
+    Returns name with one character replaced by a random letter.
+    """
+    i = rng.randrange(len(name))
+    return name[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + name[i + 1:]
+
+
+def benchmark_names(directory, count=1000, seed=0):
+    """
+    Measures mean latency of exact, prefix and typo-tolerant
+    name lookups on the snapshot-backed name index.
+    """
+    graph = load_graph(directory)
+    index = NameIndex(graph)
+    rng = random.Random(seed)
+    names = [graph.person_names[rng.randrange(len(graph.person_ids))]
+             for _ in range(count)]
+
+    lookups = [
+        ("exact", lambda name: index.exact(name)),
+        ("prefix", lambda name: index.prefix(name[:3])),
+        ("fuzzy", lambda name: index.fuzzy(with_typo(name, rng))),
+        ("resolve", lambda name: index.resolve(with_typo(name, rng))),
+    ]
+    print(f"{count} names from {directory} ({len(graph.names)} distinct)")
+    for kind, lookup in lookups:
+        start = time.perf_counter()
+        for name in names:
+            lookup(name)
+        elapsed = time.perf_counter() - start
+        print(f"    {kind:<8}{elapsed / count * 1e6:10.1f} us/lookup")
+
+
+def main():
+    commands = ("search", "frontiers", "memory", "startup", "neighbors",
+                "names", "landmarks")
+    if len(sys.argv) < 2 or sys.argv[1] not in commands:
+        sys.exit("Usage: python benchmark.py search [directory] [pairs]\n"
+                 "       python benchmark.py frontiers\n"
+                 "       python benchmark.py memory [directory]\n"
+                 "       python benchmark.py startup [directory]\n"
+                 "       python benchmark.py neighbors [directory] [pairs]\n"
+                 "       python benchmark.py names [directory]\n"
+                 "       python benchmark.py landmarks [directory] [pairs]")
+    command, args = sys.argv[1], sys.argv[2:]
+    if command == "search":
+        directory = args[0] if len(args) >= 1 else "large"
+        count = int(args[1]) if len(args) >= 2 else 100
+        benchmark_search(directory, count)
+    elif command == "frontiers":
+        benchmark_frontiers()
+    elif command == "memory":
+        benchmark_memory(args[0] if args else "large")
+    elif command == "startup":
+        benchmark_startup(args[0] if args else "large")
+    elif command == "neighbors":
+        directory = args[0] if len(args) >= 1 else "large"
+        count = int(args[1]) if len(args) >= 2 else 100
+        benchmark_neighbors(directory, count)
+    elif command == "names":
+        benchmark_names(args[0] if args else "large")
+    elif command == "landmarks":
+        directory = args[0] if len(args) >= 1 else "large"
+        count = int(args[1]) if len(args) >= 2 else 100
+        benchmark_landmarks(directory, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import json
+import os
+from collections import OrderedDict
+
+# Returned by PathCache.get when a pair has not been cached
+MISSING = object()
+
+
+class PathCache():
+    """
+    Least-recently-used cache of shortest paths keyed by
+    (source, target) IMDb ids, optionally saved to a JSON file
+    so that repeated queries are answered across runs.
+
+    The file records the version of the data its paths were found
+    in, and is ignored when loaded for a different version, or when
+    it cannot be read.
+    """
+
+    def __init__(self, capacity=10000, filename=None, version=None):
+        self.capacity = capacity
+        self.filename = filename
+        self.version = version
+        self.paths = OrderedDict()
+        if filename is not None and os.path.exists(filename):
+            self.load()
+
+    def __len__(self):
+        return len(self.paths)
+
+    def get(self, source, target):
+        """
+        Returns the cached path from source to target, or MISSING.
+        A path cached in the other direction is reversed.
+        """
+        if (source, target) in self.paths:
+            self.paths.move_to_end((source, target))
+            return self.paths[(source, target)]
+        if (target, source) in self.paths:
+            self.paths.move_to_end((target, source))
+            return reverse_path(target, self.paths[(target, source)])
+        return MISSING
+
+    def put(self, source, target, path):
+        """
+        Caches a path, evicting the least recently used one if full.
+        """
+        self.paths[(source, target)] = path
+        self.paths.move_to_end((source, target))
+        while len(self.paths) > self.capacity:
+            self.paths.popitem(last=False)
+
+    def lookup(self, source, target, search):
+        """
+        Returns the cached path from source to target,
+        calling search(source, target) and caching it on a miss.
+        """
+        path = self.get(source, target)
+        if path is MISSING:
+            path = search(source, target)
+            self.put(source, target, path)
+        return path
+
+    def load(self):
+        """
+        Reads cached paths from the cache file, oldest first,
+        unless it was saved for another version of the data.
+        """
+        try:
+            with open(self.filename, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(saved, dict) or \
+                saved.get("version") != self.version:
+            return
+        for source, target, path in saved["paths"]:
+            if path is not None:
+                path = [tuple(step) for step in path]
+            self.put(source, target, path)
+
+    def save(self):
+        """
+        Writes cached paths to the cache file, oldest first.
+        """
+        entries = [[source, target, path]
+                   for (source, target), path in self.paths.items()]
+        temporary = f"{self.filename}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump({"version": self.version, "paths": entries}, f)
+        os.replace(temporary, self.filename)
+
+
+def reverse_path(source, path):
+    """
+    Reverses a list of (movie_id, person_id) pairs leading away
+    from source into the pairs leading back to it.
+    """
+    if path is None:
+        return None
+    people = [source] + [person_id for _, person_id in path]
+    return [(path[i][0], people[i]) for i in range(len(path) - 1, -1, -1)]
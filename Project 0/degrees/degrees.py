@@ -1,7 +1,10 @@
 import csv
+import os
 import sys
 
-from util import Node, StackFrontier, QueueFrontier
+from cache import PathCache
+from snapshot import data_version, load_graph
+from util import Node, StackFrontier, QueueFrontier, join_paths
 
 # Maps names to a set of corresponding person_ids
 names = {}
@@ -57,19 +60,27 @@ def main():
         sys.exit("Usage: python degrees.py [directory]")
     directory = sys.argv[1] if len(sys.argv) == 2 else "large"
 
-    # Load data from files into memory
+    # Map the graph from its snapshot, building it on the first run
     print("Loading data...")
-    load_data(directory)
+    graph = load_graph(directory)
     print("Data loaded.")
 
-    source = person_id_for_name(input("Name: "))
+    source = person_id_for_name(input("Name: "), graph)
     if source is None:
         sys.exit("Person not found.")
-    target = person_id_for_name(input("Name: "))
+    target = person_id_for_name(input("Name: "), graph)
     if target is None:
         sys.exit("Person not found.")
 
-    path = shortest_path(source, target)
+    # Answer repeated queries from the path cache kept beside the data,
+    # while the data is unchanged
+    cache = PathCache(filename=os.path.join(directory, "paths.cache"),
+                      version=data_version(graph))
+    path = cache.lookup(source, target, graph.shortest_path)
+    try:
+        cache.save()
+    except OSError:
+        pass
 
     if path is None:
         print("Not connected.")
@@ -78,9 +89,9 @@ def main():
         print(f"{degrees} degrees of separation.")
         path = [(None, source)] + path
         for i in range(degrees):
-            person1 = people[path[i][1]]["name"]
-            person2 = people[path[i + 1][1]]["name"]
-            movie = movies[path[i + 1][0]]["title"]
+            person1 = graph.person(path[i][1])["name"]
+            person2 = graph.person(path[i + 1][1])["name"]
+            movie = graph.movie(path[i + 1][0])["title"]
             print(f"{i + 1}: {person1} and {person2} starred in {movie}")
 
 
@@ -88,55 +99,99 @@ def shortest_path(source, target):
     """
     Returns the shortest list of (movie_id, person_id) pairs
     that connect the source to the target.
-    If no possible path, returns None.
+    If no possible path, returns None. A person is never reached
+    from themselves, so the same source and target also give None.
     """
+    if source == target:
+        return None
     strt = Node(state=source, parent=None, action=None)
     que = QueueFrontier()
     que.add(strt)
 
-    visited = set()
+    visited = {source}
     while True:
         if que.empty():
             return None
         node = que.remove()
-        person_id = node.state
-        if person_id in visited:
-            continue
-
-        visited.add(person_id)
-
-        neighbors = neighbors_for_person(person_id)
-        for neighbor in neighbors:
-            movie_id = neighbor[0]
-            person_id = neighbor[1]
-            if person_id not in visited:
-                if person_id == target:
-                    path = [(movie_id, person_id)]
-                    previous = node
-                    while previous.parent is not None:
-                        path.append((previous.action, previous.state))
-                        previous = previous.parent
-                    path.reverse()
-                    return path
-                else:
-                    new_node = Node(state=person_id, parent=node, action=movie_id)
-                    que.add(new_node)
+
+        # Neighbors are streamed, so the search stops at the target
+        # without building the rest of this person's neighbor set
+        for movie_id, person_id in stream_neighbors(node.state, visited):
+            if person_id == target:
+                path = [(movie_id, person_id)]
+                previous = node
+                while previous.parent is not None:
+                    path.append((previous.action, previous.state))
+                    previous = previous.parent
+                path.reverse()
+                return path
+            visited.add(person_id)
+            new_node = Node(state=person_id, parent=node, action=movie_id)
+            que.add(new_node)
+
+
+def bidirectional_shortest_path(source, target):
+    """
+    Returns the shortest list of (movie_id, person_id) pairs
+    that connect the source to the target, searching from both
+    ends at once and always expanding the smaller frontier.
+    If no possible path, returns None. As in shortest_path, the
+    same source and target also give None.
+    """
+    if source == target:
+        return None
+
+    # Maps each reached person to (movie_id, person_id) one step
+    # closer to the source (forward) or the target (backward)
+    forward = {source: None}
+    backward = {target: None}
+    forward_frontier = [source]
+    backward_frontier = [target]
+
+    while forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            frontier, reached, other = forward_frontier, forward, backward
+        else:
+            frontier, reached, other = backward_frontier, backward, forward
+
+        # Expand one whole layer. Without an earlier meeting, every
+        # meeting found in this layer gives a path of the same length,
+        # so the search can stop at the first one
+        next_frontier = []
+        for person_id in frontier:
+            for movie_id, neighbor in stream_neighbors(person_id, reached):
+                reached[neighbor] = (movie_id, person_id)
+                if neighbor in other:
+                    return join_paths(forward, backward, neighbor)
+                next_frontier.append(neighbor)
+
+        if frontier is forward_frontier:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
 
     return None
 
 
-def person_id_for_name(name):
+def person_id_for_name(name, graph=None):
     """
     Returns the IMDB id for a person's name,
     resolving ambiguities as needed.
+    Looks the name up in graph if given, else in the loaded dicts.
     """
-    person_ids = list(names.get(name.lower(), set()))
+    if graph is None:
+        person_ids = list(names.get(name.lower(), set()))
+    else:
+        person_ids = graph.person_ids_for_name(name)
     if len(person_ids) == 0:
         return None
     elif len(person_ids) > 1:
         print(f"Which '{name}'?")
         for person_id in person_ids:
-            person = people[person_id]
+            if graph is None:
+                person = people[person_id]
+            else:
+                person = graph.person(person_id)
             name = person["name"]
             birth = person["birth"]
             print(f"ID: {person_id}, Name: {name}, Birth: {birth}")
@@ -151,6 +206,18 @@ def person_id_for_name(name):
         return person_ids[0]
 
 
+def stream_neighbors(person_id, visited):
+    """
+    Lazily yields (movie_id, person_id) pairs for people who starred
+    with a given person and are not in visited. The caller should add
+    each yielded person to visited before asking for the next pair.
+    """
+    for movie_id in people[person_id]["movies"]:
+        for neighbor in movies[movie_id]["stars"]:
+            if neighbor not in visited:
+                yield movie_id, neighbor
+
+
 def neighbors_for_person(person_id):
     """
     Returns (movie_id, person_id) pairs for people
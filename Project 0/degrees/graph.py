@@ -0,0 +1,443 @@
+import csv
+import math
+from array import array
+from bisect import bisect_left
+
+from landmarks import LandmarkIndex, landmark_fields
+from nameindex import name_fields
+from util import join_paths, path_length
+
+
+class StringTable():
+    """
+    Immutable sequence of strings stored as one UTF-8 blob
+    and an array of byte offsets, so it can be written to disk
+    and memory-mapped back without decoding every entry.
+    """
+
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    @classmethod
+    def from_strings(cls, strings):
+        offsets = array("q", [0])
+        chunks = []
+        total = 0
+        for string in strings:
+            chunk = string.encode("utf-8")
+            chunks.append(chunk)
+            total += len(chunk)
+            offsets.append(total)
+        return cls(offsets, b"".join(chunks))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return str(self.data[self.offsets[i]:self.offsets[i + 1]], "utf-8")
+
+
+class Graph():
+    """
+    Compact in-memory copy of the IMDb data.
+
+    People and movies are interned to dense integer indices, and the
+    person -> movies and movie -> stars relations are stored in
+    compressed sparse row form: the neighbors of row r are
+    index[offsets[r]:offsets[r + 1]].
+
+    Every field is a flat array or StringTable, so a graph can be
+    saved as a binary snapshot and mapped back without parsing.
+    Landmark distances are stored the same way, so searches can be
+    bounded without recomputing them on every run.
+    """
+
+    # Names of the fields that hold integer arrays, short integer
+    # arrays and string tables
+    ARRAYS = ("person_order", "movie_order", "name_order",
+              "person_offsets", "person_movies",
+              "movie_offsets", "movie_stars",
+              "name_offsets", "trigram_offsets", "trigram_names",
+              "landmarks")
+    SHORTS = ("landmark_distances",)
+    STRINGS = ("person_ids", "person_names", "person_births",
+               "movie_ids", "movie_titles", "movie_years",
+               "names", "trigrams")
+
+    def __init__(self, **fields):
+
+        # IMDb ids, names and birth years, by person index
+        self.person_ids = fields["person_ids"]
+        self.person_names = fields["person_names"]
+        self.person_births = fields["person_births"]
+
+        # IMDb ids, titles and years, by movie index
+        self.movie_ids = fields["movie_ids"]
+        self.movie_titles = fields["movie_titles"]
+        self.movie_years = fields["movie_years"]
+
+        # Indices sorted by IMDb id, and people sorted by lowercase name
+        self.person_order = fields["person_order"]
+        self.movie_order = fields["movie_order"]
+        self.name_order = fields["name_order"]
+
+        # Person -> movies and movie -> stars adjacency
+        self.person_offsets = fields["person_offsets"]
+        self.person_movies = fields["person_movies"]
+        self.movie_offsets = fields["movie_offsets"]
+        self.movie_stars = fields["movie_stars"]
+
+        # Sorted distinct lowercase names, grouping name_order by name
+        self.names = fields["names"]
+        self.name_offsets = fields["name_offsets"]
+
+        # Sorted name trigrams, each listing the names that contain it
+        self.trigrams = fields["trigrams"]
+        self.trigram_offsets = fields["trigram_offsets"]
+        self.trigram_names = fields["trigram_names"]
+
+        # Landmark person indices, and each person's distances to them
+        self.landmarks = fields["landmarks"]
+        self.landmark_distances = fields["landmark_distances"]
+        self.landmark_index = LandmarkIndex(self)
+
+        # Fingerprint of the CSV files the graph was read from, if known
+        self.sources = fields.get("sources")
+
+    @classmethod
+    def load(cls, directory):
+        """
+        Load data from CSV files into a new graph.
+        """
+
+        # Load people
+        person_ids, person_names, person_births = [], [], []
+        with open(f"{directory}/people.csv", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                person_ids.append(row["id"])
+                person_names.append(row["name"])
+                person_births.append(row["birth"])
+
+        # Load movies
+        movie_ids, movie_titles, movie_years = [], [], []
+        with open(f"{directory}/movies.csv", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                movie_ids.append(row["id"])
+                movie_titles.append(row["title"])
+                movie_years.append(row["year"])
+
+        # Load stars as person-major keys, dropping duplicates
+        person_index = {person_id: i for i, person_id in enumerate(person_ids)}
+        movie_index = {movie_id: i for i, movie_id in enumerate(movie_ids)}
+        movie_count = len(movie_ids)
+        keys = set()
+        with open(f"{directory}/stars.csv", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                person = person_index.get(row["person_id"])
+                movie = movie_index.get(row["movie_id"])
+                if person is not None and movie is not None:
+                    keys.add(person * movie_count + movie)
+        del person_index, movie_index
+
+        lower_names = [name.lower() for name in person_names]
+        name_order = sorted_order(lower_names)
+        fields = name_fields(lower_names, name_order)
+        fields["names"] = StringTable.from_strings(fields["names"])
+        fields["trigrams"] = StringTable.from_strings(fields["trigrams"])
+        fields.update(
+            person_ids=StringTable.from_strings(person_ids),
+            person_names=StringTable.from_strings(person_names),
+            person_births=StringTable.from_strings(person_births),
+            movie_ids=StringTable.from_strings(movie_ids),
+            movie_titles=StringTable.from_strings(movie_titles),
+            movie_years=StringTable.from_strings(movie_years),
+            person_order=sorted_order(person_ids),
+            movie_order=sorted_order(movie_ids),
+            name_order=name_order,
+        )
+        fields.update(adjacency(sorted(keys), len(person_ids), movie_count))
+
+        # Landmark distances are found by searching the graph itself
+        fields.update(landmarks=array("q"), landmark_distances=array("h"))
+        fields.update(landmark_fields(cls(**fields)))
+        return cls(**fields)
+
+    def movies_for(self, person):
+        """
+        Returns the movie indices a person index starred in.
+        """
+        return self.person_movies[
+            self.person_offsets[person]:self.person_offsets[person + 1]
+        ]
+
+    def stars_for(self, movie):
+        """
+        Returns the person indices that starred in a movie index.
+        """
+        return self.movie_stars[
+            self.movie_offsets[movie]:self.movie_offsets[movie + 1]
+        ]
+
+    def person_index(self, person_id):
+        """
+        Returns the index of the person with an IMDb id.
+        Raises KeyError if there is no such person.
+        """
+        return lookup(self.person_ids, self.person_order, person_id)
+
+    def movie_index(self, movie_id):
+        """
+        Returns the index of the movie with an IMDb id.
+        Raises KeyError if there is no such movie.
+        """
+        return lookup(self.movie_ids, self.movie_order, movie_id)
+
+    def person(self, person_id):
+        """
+        Returns the name and birth year of a person as a dict.
+        """
+        person = self.person_index(person_id)
+        return {"name": self.person_names[person],
+                "birth": self.person_births[person]}
+
+    def movie(self, movie_id):
+        """
+        Returns the title and year of a movie as a dict.
+        """
+        movie = self.movie_index(movie_id)
+        return {"title": self.movie_titles[movie],
+                "year": self.movie_years[movie]}
+
+    def person_ids_for_name(self, name):
+        """
+        Returns the IMDb ids of every person with the given name.
+        """
+        name = name.lower()
+        i = bisect_left(self.names, name)
+        if i == len(self.names) or self.names[i] != name:
+            return []
+        people = self.name_order[self.name_offsets[i]:self.name_offsets[i + 1]]
+        return [self.person_ids[person] for person in people]
+
+    def neighbors_for_person(self, person_id):
+        """
+        Returns (movie_id, person_id) pairs for people
+        who starred with a given person.
+        """
+        neighbors = set()
+        for movie in self.movies_for(self.person_index(person_id)):
+            for person in self.stars_for(movie):
+                neighbors.add((self.movie_ids[movie], self.person_ids[person]))
+        return neighbors
+
+    def shortest_path(self, source, target, max_degrees=None, prune=True):
+        """
+        Returns the shortest list of (movie_id, person_id) pairs
+        that connect the source to the target.
+        If no possible path, or none within max_degrees, returns None.
+        If prune is True, the search is bounded by landmark distances.
+        """
+        path = self.shortest_index_path(
+            self.person_index(source), self.person_index(target),
+            max_degrees, self.landmark_index if prune else None
+        )
+        if path is None:
+            return None
+        return [(self.movie_ids[movie], self.person_ids[person])
+                for movie, person in path]
+
+    def paths_from(self, source, targets, landmarks=None):
+        """
+        Breadth-first search from one person index that stops as soon
+        as every target index has been reached. Returns a dict mapping
+        each target to its list of (movie, person) index pairs,
+        or to None if it is not connected to the source.
+
+        With a LandmarkIndex, targets it shows are not connected are
+        not waited for, so the search need not cover the whole
+        component to find out.
+        """
+        parents = {source: None}
+        remaining = set(targets) - {source}
+        if landmarks is not None:
+            remaining = {target for target in remaining
+                         if landmarks.lower_bound(source, target) < math.inf}
+        frontier = [source]
+        movies_for = self.movies_for
+        stars_for = self.stars_for
+
+        while frontier and remaining:
+            next_frontier = []
+            for person in frontier:
+                for movie in movies_for(person):
+                    for neighbor in stars_for(movie):
+                        if neighbor in parents:
+                            continue
+                        parents[neighbor] = (movie, person)
+                        next_frontier.append(neighbor)
+                        if neighbor in remaining:
+                            remaining.remove(neighbor)
+                            if not remaining:
+                                return paths_to(parents, targets)
+            frontier = next_frontier
+
+        return paths_to(parents, targets)
+
+    def shortest_index_path(self, source, target, max_degrees=None,
+                            landmarks=None):
+        """
+        Bidirectional breadth-first search over person indices.
+        Returns a list of (movie, person) index pairs from source
+        to target, or None if they are not connected.
+
+        If max_degrees is given, gives up with None as soon as every
+        remaining path is provably longer. A LandmarkIndex answers
+        unconnected pairs without searching, caps max_degrees at its
+        upper bound, and prunes people who cannot lead to a path that
+        short.
+        """
+        if source == target:
+            return []
+        if max_degrees is None:
+            max_degrees = math.inf
+        if landmarks is not None:
+            lower = landmarks.lower_bound(source, target)
+            if lower == math.inf or lower > max_degrees:
+                return None
+            max_degrees = min(max_degrees,
+                              landmarks.upper_bound(source, target))
+            if max_degrees == math.inf:
+                landmarks = None
+
+        # Maps each reached person to (movie, person) one step
+        # closer to the source (forward) or the target (backward)
+        forward = {source: None}
+        backward = {target: None}
+        forward_frontier = [source]
+        backward_frontier = [target]
+        depths = {source: 0, target: 0}
+        movies_for = self.movies_for
+        stars_for = self.stars_for
+
+        while forward_frontier and backward_frontier:
+            if depths[source] + depths[target] + 1 > max_degrees:
+                return None
+            if len(forward_frontier) <= len(backward_frontier):
+                frontier, reached, other = forward_frontier, forward, backward
+                root, goal = source, target
+            else:
+                frontier, reached, other = backward_frontier, backward, forward
+                root, goal = target, source
+            depths[root] += 1
+
+            # Expand one layer. Every meeting in it through people
+            # that were not pruned gives a path of the same length,
+            # and one through a pruned person is too long, so the
+            # search stops at the first meeting short enough
+            next_frontier = []
+            for person in frontier:
+
+                # Skip people every path through whom is too long,
+                # checked only for the people expanded, as the last
+                # layer reached is usually the largest
+                if landmarks is not None and depths[root] - 1 + \
+                        landmarks.lower_bound(person, goal) > max_degrees:
+                    continue
+                for movie in movies_for(person):
+                    for neighbor in stars_for(movie):
+                        if neighbor in reached:
+                            continue
+                        reached[neighbor] = (movie, person)
+                        next_frontier.append(neighbor)
+                        if neighbor not in other:
+                            continue
+                        length = path_length(forward, neighbor) + \
+                            path_length(backward, neighbor)
+                        if length <= max_degrees:
+                            return join_paths(forward, backward, neighbor)
+
+            if frontier is forward_frontier:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+
+        return None
+
+
+def paths_to(parents, targets):
+    """
+    Returns a dict mapping each target index to its list of
+    (movie, person) index pairs from the root of a parents map,
+    or to None if the search did not reach it.
+    """
+    paths = {}
+    for target in targets:
+        if target in parents:
+            paths[target] = join_paths(parents, {target: None}, target)
+        else:
+            paths[target] = None
+    return paths
+
+
+def adjacency(keys, person_count, movie_count):
+    """
+    Builds both CSR adjacency relations from sorted person-major
+    star keys of the form person * movie_count + movie.
+    """
+
+    # Person -> movies comes straight from the sorted keys
+    person_degree = array("q", [0]) * person_count
+    movie_degree = array("q", [0]) * movie_count
+    person_movies = array("q", [0]) * len(keys)
+    for i, key in enumerate(keys):
+        person, movie = divmod(key, movie_count)
+        person_movies[i] = movie
+        person_degree[person] += 1
+        movie_degree[movie] += 1
+    person_offsets = offsets_for(person_degree)
+    movie_offsets = offsets_for(movie_degree)
+
+    # Movie -> stars by counting sort over the same keys
+    cursor = movie_offsets[:-1]
+    movie_stars = array("q", [0]) * len(keys)
+    for key in keys:
+        person, movie = divmod(key, movie_count)
+        movie_stars[cursor[movie]] = person
+        cursor[movie] += 1
+
+    return dict(person_offsets=person_offsets, person_movies=person_movies,
+                movie_offsets=movie_offsets, movie_stars=movie_stars)
+
+
+def offsets_for(degrees):
+    """
+    Returns the CSR offsets array for a list of row degrees.
+    """
+    offsets = array("q", [0]) * (len(degrees) + 1)
+    total = 0
+    for row, degree in enumerate(degrees):
+        total += degree
+        offsets[row + 1] = total
+    return offsets
+
+
+def sorted_order(strings):
+    """
+    Returns an array of indices into strings, in sorted string order.
+    """
+    return array("q", sorted(range(len(strings)), key=strings.__getitem__))
+
+
+def lookup(table, order, string):
+    """
+    Returns the index of string in a StringTable, given the
+    table's sorted order. Raises KeyError if it is missing.
+    """
+    i = bisect_left(order, string, key=table.__getitem__)
+    if i < len(order) and table[order[i]] == string:
+        return order[i]
+    raise KeyError(string)
@@ -0,0 +1,109 @@
+import heapq
+import math
+from array import array
+from operator import add, sub
+
+# Distance recorded for people a landmark cannot reach, so large that
+# any bound involving it is further than any real separation
+UNREACHABLE = 2 ** 15 - 1
+
+# How many landmarks a graph stores distances from
+COUNT = 16
+
+
+class LandmarkIndex():
+    """
+    Breadth-first distances from a few highly connected people
+    ("landmarks") to every person in a graph, read from the graph's
+    landmark_distances array: the distances of person p are
+    landmark_distances[p * count:(p + 1) * count].
+
+    By the triangle inequality, for any landmark L the separation
+    between s and t is at least |d(L, s) - d(L, t)| and at most
+    d(L, s) + d(L, t), which bounds a query without searching.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.count = len(graph.landmarks)
+        self.distances = graph.landmark_distances
+
+    def row(self, person):
+        """
+        Returns the distances from every landmark to a person index.
+        """
+        return self.distances[person * self.count:(person + 1) * self.count]
+
+    def lower_bound(self, source, target):
+        """
+        Returns a lower bound on the degrees of separation between
+        two person indices, or math.inf if they cannot be connected.
+        """
+        bound = max(map(abs, map(sub, self.row(source), self.row(target))),
+                    default=0)
+        return math.inf if bound > UNREACHABLE // 2 else bound
+
+    def upper_bound(self, source, target):
+        """
+        Returns an upper bound on the degrees of separation between
+        two person indices, or math.inf if no landmark reaches both.
+        """
+        bound = min(map(add, self.row(source), self.row(target)),
+                    default=UNREACHABLE)
+        return math.inf if bound >= UNREACHABLE else bound
+
+    def bounds(self, source_id, target_id):
+        """
+        Returns (lower, upper) bounds on the degrees of separation
+        between two people given by IMDb id.
+        """
+        source = self.graph.person_index(source_id)
+        target = self.graph.person_index(target_id)
+        return self.lower_bound(source, target), self.upper_bound(source, target)
+
+
+def landmark_fields(graph, count=COUNT):
+    """
+    Returns the landmarks and landmark_distances arrays for a graph,
+    choosing its count most connected people as landmarks.
+    """
+    landmarks = array("q", most_connected(graph, count))
+    distances = array("h", [UNREACHABLE]) * (len(graph.person_ids) *
+                                             len(landmarks))
+    for i, landmark in enumerate(landmarks):
+        distances[i::len(landmarks)] = distances_from(graph, landmark)
+    return {"landmarks": landmarks, "landmark_distances": distances}
+
+
+def most_connected(graph, count):
+    """
+    Returns the count person indices with the most co-star slots,
+    summed over the casts of every movie they starred in.
+    """
+    def connections(person):
+        return sum(graph.movie_offsets[movie + 1] - graph.movie_offsets[movie]
+                   for movie in graph.movies_for(person))
+
+    return heapq.nlargest(count, range(len(graph.person_ids)), key=connections)
+
+
+def distances_from(graph, source):
+    """
+    Returns an array of breadth-first distances from a person index
+    to every person, with UNREACHABLE for people in other components.
+    """
+    distances = array("h", [UNREACHABLE]) * len(graph.person_ids)
+    distances[source] = 0
+    frontier = [source]
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for person in frontier:
+            for movie in graph.movies_for(person):
+                for neighbor in graph.stars_for(movie):
+                    if distances[neighbor] == UNREACHABLE:
+                        distances[neighbor] = depth
+                        next_frontier.append(neighbor)
+        frontier = next_frontier
+    return distances
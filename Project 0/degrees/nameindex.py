@@ -0,0 +1,181 @@
+from array import array
+from bisect import bisect_left
+from collections import Counter
+
+
+class NameIndex():
+    """
+    Non-interactive name lookups over a Graph: exact and prefix
+    search by bisecting the sorted table of distinct lowercase names,
+    and typo-tolerant search through a trigram index over that table.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    def exact(self, name):
+        """
+        Returns the IMDb ids of every person with exactly this name,
+        ignoring case.
+        """
+        i = self.find(name.lower())
+        return [] if i is None else self.person_ids_for(i)
+
+    def prefix(self, prefix, limit=10):
+        """
+        Returns up to limit distinct names, in sorted order,
+        that start with prefix, ignoring case.
+        """
+        names = self.graph.names
+        prefix = prefix.lower()
+        matches = []
+        i = bisect_left(names, prefix)
+        while i < len(names) and len(matches) < limit:
+            name = names[i]
+            if not name.startswith(prefix):
+                break
+            matches.append(self.display_name(i))
+            i += 1
+        return matches
+
+    def fuzzy(self, name, limit=5, threshold=0.5):
+        """
+        Returns up to limit (similarity, name) pairs for the distinct
+        names most similar to name, best first, where similarity is
+        the Jaccard index of the two names' trigram sets.
+
+        Any name within one edit of the query shares all but at most
+        three of its trigrams, so candidates are only drawn from the
+        postings of the query's four rarest trigrams.
+        """
+        grams = trigrams(name.lower())
+        postings = sorted((self.trigram_postings(gram) for gram in grams),
+                          key=len)
+        candidates = Counter()
+        for posting in postings[:4]:
+            candidates.update(posting)
+
+        scored = []
+        for i in candidates:
+            other = trigrams(self.graph.names[i])
+            similarity = len(grams & other) / len(grams | other)
+            if similarity >= threshold:
+                scored.append((similarity, i))
+        scored.sort(key=lambda match: (-match[0], match[1]))
+        return [(similarity, self.display_name(i))
+                for similarity, i in scored[:limit]]
+
+    def resolve(self, name, policy="most_films", birth=None, fuzzy=True):
+        """
+        Returns a single IMDb id for a name without prompting,
+        or None if nothing matches.
+
+        If the exact name is unknown and fuzzy is True, the most
+        similar name is used instead. Several people with the name
+        are told apart by policy: "most_films" picks whoever starred
+        in the most movies, and "closest_birth" picks whoever was born
+        closest to the birth year given.
+        """
+        person_ids = self.exact(name)
+        if not person_ids and fuzzy:
+            matches = self.fuzzy(name, limit=1)
+            if matches:
+                person_ids = self.exact(matches[0][1])
+        if not person_ids:
+            return None
+
+        graph = self.graph
+        if policy == "most_films":
+            def rank(person_id):
+                person = graph.person_index(person_id)
+                return len(graph.movies_for(person))
+            return max(person_ids, key=rank)
+        elif policy == "closest_birth":
+            if birth is None:
+                raise ValueError("closest_birth policy needs a birth year")
+
+            def distance(person_id):
+                born = graph.person(person_id)["birth"]
+                return abs(int(born) - birth) if born else float("inf")
+            return min(person_ids, key=distance)
+        raise ValueError(f"unknown disambiguation policy: {policy}")
+
+    def find(self, name):
+        """
+        Returns the position of a lowercase name in the sorted
+        names table, or None if it is not there.
+        """
+        names = self.graph.names
+        i = bisect_left(names, name)
+        if i < len(names) and names[i] == name:
+            return i
+        return None
+
+    def person_ids_for(self, i):
+        """
+        Returns the IMDb ids of the people with the ith distinct name.
+        """
+        graph = self.graph
+        people = graph.name_order[graph.name_offsets[i]:graph.name_offsets[i + 1]]
+        return [graph.person_ids[person] for person in people]
+
+    def display_name(self, i):
+        """
+        Returns the ith distinct name as spelled by its first person.
+        """
+        graph = self.graph
+        return graph.person_names[graph.name_order[graph.name_offsets[i]]]
+
+    def trigram_postings(self, gram):
+        """
+        Returns the positions of the distinct names containing a trigram.
+        """
+        graph = self.graph
+        i = bisect_left(graph.trigrams, gram)
+        if i == len(graph.trigrams) or graph.trigrams[i] != gram:
+            return []
+        return graph.trigram_names[
+            graph.trigram_offsets[i]:graph.trigram_offsets[i + 1]
+        ]
+
+
+def trigrams(name):
+    """
+    Returns the set of three-character substrings of a padded name.
+    """
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def name_fields(lower_names, name_order):
+    """
+    Builds the name index fields of a Graph from every person's
+    lowercase name and the person indices sorted by that name.
+
+    Returns the sorted distinct names, CSR offsets grouping
+    name_order by distinct name, the sorted trigrams, and CSR
+    postings listing the distinct names containing each trigram.
+    """
+    names = []
+    name_offsets = array("q")
+    for position, person in enumerate(name_order):
+        name = lower_names[person]
+        if not names or names[-1] != name:
+            names.append(name)
+            name_offsets.append(position)
+    name_offsets.append(len(name_order))
+
+    postings = {}
+    for i, name in enumerate(names):
+        for gram in trigrams(name):
+            postings.setdefault(gram, array("q")).append(i)
+
+    grams = sorted(postings)
+    trigram_offsets = array("q", [0])
+    trigram_names = array("q")
+    for gram in grams:
+        trigram_names.extend(postings[gram])
+        trigram_offsets.append(len(trigram_names))
+
+    return dict(names=names, name_offsets=name_offsets, trigrams=grams,
+                trigram_offsets=trigram_offsets, trigram_names=trigram_names)
@@ -0,0 +1,193 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+from graph import Graph, StringTable
+
+# Identifies snapshot files written by this module
+MAGIC = b"DEGREES3"
+
+# CSV files a snapshot is built from
+SOURCES = ("people.csv", "movies.csv", "stars.csv")
+
+
+def snapshot_path(directory):
+    """
+    Returns the path of the snapshot for a data directory.
+    """
+    return os.path.join(directory, "graph.snapshot")
+
+
+def load_graph(directory):
+    """
+    Returns the graph for a data directory, mapped from its snapshot
+    when the snapshot is up to date with the CSV files, and otherwise
+    parsed from the CSV files and written back as a fresh snapshot.
+    """
+    path = snapshot_path(directory)
+    graph = open_snapshot(path, directory)
+    if graph is not None:
+        return graph
+
+    graph = Graph.load(directory)
+    graph.sources = fingerprint(directory, hashed=True)
+    try:
+        save_snapshot(graph, path, graph.sources)
+    except OSError:
+        pass
+    return graph
+
+
+def data_version(graph):
+    """
+    Returns the SHA-256 digests of the CSV files a graph was read
+    from, which change only when their contents do, or None if the
+    graph was not loaded from a data directory.
+    """
+    if graph.sources is None:
+        return None
+    return [graph.sources[source]["sha256"] for source in SOURCES]
+
+
+def fingerprint(directory, hashed=False):
+    """
+    Returns the modification time and size of each CSV file,
+    and its SHA-256 digest if hashed is True.
+    """
+    sources = {}
+    for source in SOURCES:
+        path = os.path.join(directory, source)
+        stat = os.stat(path)
+        sources[source] = {"mtime": stat.st_mtime_ns, "size": stat.st_size}
+        if hashed:
+            sources[source]["sha256"] = file_digest(path)
+    return sources
+
+
+def file_digest(path):
+    """
+    Returns the SHA-256 hex digest of a file.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def refreshed(recorded, directory):
+    """
+    Returns the recorded fingerprint, with current mtimes, if the CSV
+    files still match it, or None if they do not. Files whose mtime
+    changed are hashed before deciding they differ.
+    """
+    try:
+        current = fingerprint(directory)
+    except OSError:
+        return None
+    sources = {}
+    for source in SOURCES:
+        if source not in recorded:
+            return None
+        if recorded[source]["size"] != current[source]["size"]:
+            return None
+        sources[source] = dict(recorded[source],
+                               mtime=current[source]["mtime"])
+        if recorded[source]["mtime"] == current[source]["mtime"]:
+            continue
+        path = os.path.join(directory, source)
+        if recorded[source]["sha256"] != file_digest(path):
+            return None
+    return sources
+
+
+def save_snapshot(graph, path, sources):
+    """
+    Writes a graph to path as a header followed by its raw arrays.
+
+    The file starts with MAGIC and the length of a JSON header that
+    records the CSV fingerprint and the offset and length of every
+    section. Sections are 8-byte aligned so integer arrays can be
+    cast in place from a memory map.
+    """
+    sections = []
+    for name in Graph.ARRAYS + Graph.SHORTS:
+        sections.append((name, getattr(graph, name)))
+    for name in Graph.STRINGS:
+        table = getattr(graph, name)
+        sections.append((f"{name}.offsets", table.offsets))
+        sections.append((f"{name}.data", table.data))
+
+    # Lay out sections after a header whose size is not yet known
+    layout = {}
+    offset = 0
+    for name, data in sections:
+        size = memoryview(data).nbytes
+        layout[name] = [offset, size]
+        offset += size + (-size % 8)
+    header = json.dumps({"sources": sources, "sections": layout}).encode()
+    start = len(MAGIC) + 8 + len(header)
+    start += -start % 8
+
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<q", len(header)))
+        f.write(header)
+        f.write(bytes(start - f.tell()))
+        for name, data in sections:
+            f.seek(start + layout[name][0])
+            f.write(memoryview(data).cast("B"))
+        f.truncate(start + offset)
+    os.replace(temporary, path)
+
+
+def open_snapshot(path, directory=None):
+    """
+    Maps a snapshot file and returns a Graph whose fields are views
+    into the mapping. Returns None if the file is missing, is not a
+    snapshot, or no longer matches the CSV files in directory.
+    """
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                return None
+            header_length, = struct.unpack("<q", f.read(8))
+            header = json.loads(f.read(header_length))
+            start = len(MAGIC) + 8 + header_length
+            start += -start % 8
+            sources = header["sources"]
+            if directory is not None:
+                sources = refreshed(header["sources"], directory)
+                if sources is None:
+                    return None
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    view = memoryview(mapping)
+
+    def section(name):
+        offset, size = header["sections"][name]
+        return view[start + offset:start + offset + size]
+
+    fields = {"sources": sources}
+    for name in Graph.ARRAYS:
+        fields[name] = section(name).cast("q")
+    for name in Graph.SHORTS:
+        fields[name] = section(name).cast("h")
+    for name in Graph.STRINGS:
+        fields[name] = StringTable(section(f"{name}.offsets").cast("q"),
+                                   section(f"{name}.data"))
+    graph = Graph(**fields)
+
+    # Record new mtimes of unchanged files, so that later runs need
+    # not hash them again
+    if sources != header["sources"]:
+        try:
+            save_snapshot(graph, path, sources)
+        except OSError:
+            pass
+    return graph
@@ -1,3 +1,6 @@
+from collections import deque
+
+
 class Node():
     def __init__(self, state, parent, action):
         self.state = state
@@ -5,15 +8,24 @@ class Node():
         self.action = action
 
 
-class StackFrontier():
+class DequeFrontier():
+    """
+    Frontier backed by a deque, with a count of how many queued
+    nodes hold each state so that push, pop and contains_state
+    all run in constant time. Subclasses define pop, which takes
+    the next node off the deque.
+    """
+
     def __init__(self):
-        self.frontier = []
+        self.frontier = deque()
+        self.states = {}
 
     def add(self, node):
         self.frontier.append(node)
+        self.states[node.state] = self.states.get(node.state, 0) + 1
 
     def contains_state(self, state):
-        return any(node.state == state for node in self.frontier)
+        return state in self.states
 
     def empty(self):
         return len(self.frontier) == 0
@@ -21,18 +33,62 @@ class StackFrontier():
     def remove(self):
         if self.empty():
             raise Exception("empty frontier")
+        node = self.pop()
+        count = self.states[node.state] - 1
+        if count:
+            self.states[node.state] = count
         else:
-            node = self.frontier[-1]
-            self.frontier = self.frontier[:-1]
-            return node
+            del self.states[node.state]
+        return node
 
 
-class QueueFrontier(StackFrontier):
+class DequeStackFrontier(DequeFrontier):
 
-    def remove(self):
-        if self.empty():
-            raise Exception("empty frontier")
-        else:
-            node = self.frontier[0]
-            self.frontier = self.frontier[1:]
-            return node
+    def pop(self):
+        return self.frontier.pop()
+
+
+class DequeQueueFrontier(DequeFrontier):
+
+    def pop(self):
+        return self.frontier.popleft()
+
+
+class StackFrontier(DequeStackFrontier):
+    pass
+
+
+class QueueFrontier(DequeQueueFrontier):
+    pass
+
+
+def path_length(parents, node):
+    """
+    Returns the number of steps from node back to the root of a parents map.
+    """
+    length = 0
+    while parents[node] is not None:
+        node = parents[node][1]
+        length += 1
+    return length
+
+
+def join_paths(forward, backward, meeting):
+    """
+    Joins forward and backward parent maps at the meeting node
+    into a list of (edge, node) pairs from source to target.
+    """
+    path = []
+    node = meeting
+    while forward[node] is not None:
+        edge, previous = forward[node]
+        path.append((edge, node))
+        node = previous
+    path.reverse()
+
+    node = meeting
+    while backward[node] is not None:
+        edge, following = backward[node]
+        path.append((edge, following))
+        node = following
+    return path
@@ -0,0 +1,96 @@
+"""
+Runs the AI's search in a worker process, so the game window
+keeps drawing frames while the computer is thinking.
+"""
+
+import multiprocessing
+
+import tictactoe as ttt
+
+
+def search(board, game):
+    """
+    Returns the AI's action on the board, and the stats of its search
+    if the engine records them.
+    """
+    engine = ttt if game is None else game
+    move = engine.minimax(board)
+    return move, getattr(engine, "last_search", None)
+
+
+def choose(connection, board, game):
+    """
+    Sends the result of searching the board back over connection.
+    """
+    connection.send(search(board, game))
+    connection.close()
+
+
+class Thinker():
+    """
+    Computes one AI move at a time in a worker process.
+    The game loop starts a search, polls done() once per frame,
+    and collects the move with result().
+    """
+
+    def __init__(self, game=None):
+        """
+        game is an mnk.Game to play with, or None for tictactoe.py.
+        """
+        self.game = game
+        self.board = None
+        self.process = None
+        self.connection = None
+
+    def thinking(self):
+        """
+        Checks whether a search has been started and not collected.
+        """
+        return self.process is not None
+
+    def start(self, board):
+        """
+        Starts searching for the AI's move on the board.
+        """
+        self.cancel()
+        self.board = board
+        self.connection, child = multiprocessing.Pipe(duplex=False)
+        self.process = multiprocessing.Process(
+            target=choose, args=(child, board, self.game), daemon=True
+        )
+        self.process.start()
+        child.close()
+
+    def done(self):
+        """
+        Checks whether the current search has finished.
+        """
+        return self.process is not None and self.connection.poll()
+
+    def result(self):
+        """
+        Returns (action, search stats) from the finished search.
+        If the worker died without sending them, the search is run
+        again here, which stalls the window but keeps the game going.
+        """
+        try:
+            move, stats = self.connection.recv()
+        except (EOFError, OSError):
+            move, stats = search(self.board, self.game)
+        self.process.join()
+        self.connection.close()
+        self.process = None
+        self.connection = None
+        return move, stats
+
+    def cancel(self):
+        """
+        Stops any search in progress and discards its result.
+        """
+        if self.process is None:
+            return
+        self.process.terminate()
+        self.process.join()
+        self.connection.close()
+        self.process = None
+        self.connection = None
@@ -0,0 +1,265 @@
+import sys
+import time
+
+import bitboard
+import mnk
+import tictactoe as ttt
+
+
+def search(board, table):
+    """
+    Runs minimax on board from a cold start, with or without the
+    transposition table. Returns the move, nodes expanded and time.
+    """
+    ttt.transpositions = {} if table else None
+    ttt.solutions = False
+    ttt.nodes = 0
+    start = time.perf_counter()
+    move = ttt.minimax(board)
+    ttt.solutions = None
+    return move, ttt.nodes, time.perf_counter() - start
+
+
+def benchmark_table():
+    """
+    Compares node expansions and time for the opening move
+    and every reply to it, with and without the transposition table.
+    """
+    boards = [ttt.initial_state()]
+    boards += [ttt.result(boards[0], action)
+               for action in sorted(ttt.actions(boards[0]))]
+
+    print(f"{'position':<12}{'plain nodes':>12}{'table nodes':>12}"
+          f"{'plain ms':>10}{'table ms':>10}")
+    for board in boards:
+        plain_move, plain_nodes, plain_time = search(board, table=False)
+        table_move, table_nodes, table_time = search(board, table=True)
+        if plain_move != table_move:
+            sys.exit("Searches disagree on the best move.")
+        print(f"{encode(board):<12}{plain_nodes:>12}{table_nodes:>12}"
+              f"{plain_time * 1000:>10.1f}{table_time * 1000:>10.1f}")
+    ttt.transpositions = {}
+
+
+def reachable_positions():
+    """
+    Returns every position reachable from the initial state,
+    including terminal ones, found through actions and result.
+    """
+    start = ttt.initial_state()
+    positions = {encode(start): start}
+    stack = [start]
+    while stack:
+        board = stack.pop()
+        if ttt.terminal(board):
+            continue
+        for action in ttt.actions(board):
+            child = ttt.result(board, action)
+            key = encode(child)
+            if key not in positions:
+                positions[key] = child
+                stack.append(child)
+    return list(positions.values())
+
+
+def encode(board):
+    """
+    Returns a string encoding of the board, row by row.
+    """
+    return "".join(cell or "-" for row in board for cell in row)
+
+
+def timed(engine, board):
+    """
+    Runs an engine on board from a cold start.
+    Returns the move, nodes expanded and time.
+    """
+    ttt.transpositions = {}
+    ttt.solutions = False
+    ttt.nodes = 0
+    start = time.perf_counter()
+    move = engine(board)
+    ttt.solutions = None
+    return move, ttt.nodes, time.perf_counter() - start
+
+
+def benchmark_alphabeta():
+    """
+    Compares node counts and time per position for minimax with the
+    transposition table and alpha-beta with and without move ordering.
+    """
+    engines = [
+        ("minimax", ttt.minimax),
+        ("alphabeta", lambda board: ttt.alphabeta(board, ordering=None)),
+        ("ordered", ttt.alphabeta),
+    ]
+    boards = [ttt.initial_state()]
+    boards += [ttt.result(boards[0], action)
+               for action in sorted(ttt.actions(boards[0]))]
+
+    print(f"{'position':<12}" + "".join(
+        f"{name + ' nodes':>18}{'ms':>8}" for name, _ in engines))
+    for board in boards:
+        row = f"{encode(board):<12}"
+        for name, engine in engines:
+            _, nodes, elapsed = timed(engine, board)
+            row += f"{nodes:>18}{elapsed * 1000:>8.1f}"
+        print(row)
+    ttt.transpositions = {}
+
+
+def benchmark_bitboard():
+    """
+    Compares node throughput of a full game-tree search
+    on list-of-lists boards and on bitboards.
+    """
+    ttt.transpositions = None
+    ttt.nodes = 0
+    start = time.perf_counter()
+    list_value = ttt.max_val(ttt.initial_state())
+    list_time = time.perf_counter() - start
+    list_nodes = ttt.nodes
+    ttt.transpositions = {}
+
+    bitboard.nodes = 0
+    start = time.perf_counter()
+    bit_value = bitboard.negamax(0, 0)
+    bit_time = time.perf_counter() - start
+    bit_nodes = bitboard.nodes
+
+    if list_value != bit_value:
+        sys.exit("Engines disagree on the value of the game.")
+    print("Full game tree from the initial state")
+    print(f"    list engine: {list_nodes} nodes in {list_time:.2f}s "
+          f"({list_nodes / list_time:,.0f} nodes/s)")
+    print(f"    bitboard:    {bit_nodes} nodes in {bit_time:.2f}s "
+          f"({bit_nodes / bit_time:,.0f} nodes/s)")
+
+
+def benchmark_mnk(time_limit=1.0):
+    """
+    Reports the depth reached and nodes per second of the
+    m,n,k engine's opening move within a time budget.
+    """
+    print(f"Opening move with a {time_limit:.1f}s budget")
+    print(f"{'game':<10}{'move':>8}{'depth':>7}{'complete':>10}"
+          f"{'nodes':>10}{'nodes/s':>12}")
+    for m, n, k in [(3, 3, 3), (4, 4, 4), (5, 5, 4), (7, 7, 5)]:
+        game = mnk.Game(m, n, k, time_limit=time_limit)
+        move = game.minimax(game.initial_state())
+        stats = game.last_search
+        print(f"{f'{m},{n},{k}':<10}{str(move):>8}{stats['depth']:>7}"
+              f"{str(stats['complete']):>10}{stats['nodes']:>10}"
+              f"{stats['nodes_per_second']:>12,.0f}")
+
+
+def benchmark_solutions():
+    """
+    Compares loading and querying the solution table
+    with live minimax search over every reachable position.
+    """
+    positions = [board for board in reachable_positions()
+                 if not ttt.terminal(board)]
+
+    ttt.solutions = None
+    start = time.perf_counter()
+    if ttt.solution(ttt.initial_state()) is None:
+        sys.exit("No solution table; run python solve.py first.")
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    table_moves = [ttt.minimax(board) for board in positions]
+    table_time = time.perf_counter() - start
+
+    ttt.solutions = False
+    ttt.transpositions = {}
+    start = time.perf_counter()
+    live_moves = [ttt.minimax(board) for board in positions]
+    live_time = time.perf_counter() - start
+    ttt.solutions = None
+
+    if table_moves != live_moves:
+        sys.exit("Solution table disagrees with live search.")
+    count = len(positions)
+    print(f"{count} non-terminal reachable positions")
+    print(f"    table load:   {load_time * 1000:8.2f}ms")
+    print(f"    table lookup: {table_time / count * 1e6:8.2f}us/move")
+    print(f"    live search:  {live_time / count * 1e6:8.2f}us/move "
+          f"(sharing one transposition table)")
+
+
+def verify():
+    """
+    Checks that alpha-beta, with and without move ordering, returns
+    exactly the move minimax returns in every reachable position.
+    Minimax searches live, so the check does not depend on
+    solutions.bin being up to date.
+    """
+    table = ttt.solutions
+    ttt.solutions = False
+    positions = [board for board in reachable_positions()
+                 if not ttt.terminal(board)]
+    for board in positions:
+        expected = ttt.minimax(board)
+        for ordering in (ttt.CENTER_FIRST, None):
+            move = ttt.alphabeta(board, ordering=ordering)
+            if move != expected:
+                sys.exit(f"{encode(board)}: alphabeta chose {move}, "
+                         f"minimax chose {expected}")
+    print(f"alphabeta agrees with minimax on all {len(positions)} "
+          f"non-terminal reachable positions.")
+
+    # The bitboard engine may break ties differently, so compare values
+    for board in positions:
+        if bitboard.decode(*bitboard.encode(board)) != board:
+            sys.exit(f"{encode(board)}: bitboard round trip failed")
+        expected = ttt.minimax(board)
+        move = bitboard.minimax(board)
+        if value_after(board, move) != value_after(board, expected):
+            sys.exit(f"{encode(board)}: bitboard chose {move}, "
+                     f"worth less than minimax's {expected}")
+    print(f"bitboard moves are optimal in all {len(positions)} "
+          f"non-terminal reachable positions.")
+
+    game = mnk.Game(3, 3, 3, time_limit=60)
+    for board in positions:
+        move = game.minimax(board)
+        if value_after(board, move) != value_after(board, ttt.minimax(board)):
+            sys.exit(f"{encode(board)}: 3,3,3 engine chose {move}, "
+                     f"worth less than minimax's move")
+    print(f"3,3,3 engine moves are optimal in all {len(positions)} "
+          f"non-terminal reachable positions.")
+    ttt.solutions = table
+
+
+def value_after(board, move):
+    """
+    Returns the minimax value of the board after making move.
+    """
+    child = ttt.result(board, move)
+    if ttt.player(child) == ttt.X:
+        return ttt.max_val(child)
+    return ttt.min_val(child)
+
+
+def main():
+    commands = ("table", "alphabeta", "bitboard", "mnk", "solutions",
+                "verify")
+    if len(sys.argv) != 2 or sys.argv[1] not in commands:
+        sys.exit(f"Usage: python benchmark.py {'|'.join(commands)}")
+    if sys.argv[1] == "table":
+        benchmark_table()
+    elif sys.argv[1] == "alphabeta":
+        benchmark_alphabeta()
+    elif sys.argv[1] == "bitboard":
+        benchmark_bitboard()
+    elif sys.argv[1] == "mnk":
+        benchmark_mnk()
+    elif sys.argv[1] == "solutions":
+        benchmark_solutions()
+    elif sys.argv[1] == "verify":
+        verify()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Tic Tac Toe engine on bitboards
+
+A position is two 9-bit integers, one per player, where bit 3 * i + j
+is set if that player has a mark in cell (i, j).
+"""
+
+import tictactoe as ttt
+
+# All nine cells occupied
+FULL = 0b111111111
+
+# Masks of the three rows, three columns and two diagonals
+LINES = [
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100,
+]
+
+# Whether each 9-bit set of marks contains a complete line
+WINS = [any(marks & line == line for line in LINES) for marks in range(1 << 9)]
+
+# Number of positions expanded by negamax and alphabeta
+nodes = 0
+
+
+def encode(board):
+    """
+    Returns the (x, o) bitboards for a list-of-lists board.
+    """
+    x = o = 0
+    for i in range(3):
+        for j in range(3):
+            if board[i][j] == ttt.X:
+                x |= 1 << (3 * i + j)
+            elif board[i][j] == ttt.O:
+                o |= 1 << (3 * i + j)
+    return x, o
+
+
+def decode(x, o):
+    """
+    Returns the list-of-lists board for (x, o) bitboards.
+    """
+    board = ttt.initial_state()
+    for cell in range(9):
+        if x >> cell & 1:
+            board[cell // 3][cell % 3] = ttt.X
+        elif o >> cell & 1:
+            board[cell // 3][cell % 3] = ttt.O
+    return board
+
+
+def moves(x, o):
+    """
+    Yields the single-bit masks of the empty cells.
+    """
+    empty = FULL & ~(x | o)
+    while empty:
+        bit = empty & -empty
+        yield bit
+        empty ^= bit
+
+
+def negamax(mine, theirs):
+    """
+    Returns the value of the position for the player to move, whose
+    marks are mine: 1 for a win, -1 for a loss and 0 for a draw.
+    Searches the full game tree.
+    """
+    global nodes
+
+    if WINS[theirs]:
+        return -1
+    if mine | theirs == FULL:
+        return 0
+    nodes += 1
+
+    q = -1
+    for bit in moves(mine, theirs):
+        q = max(q, -negamax(theirs, mine | bit))
+    return q
+
+
+def alphabeta(mine, theirs, alpha=-1, beta=1):
+    """
+    Returns the value of the position for the player to move,
+    pruning lines that cannot change it. The result is exact if
+    it lies strictly between alpha and beta.
+    """
+    global nodes
+
+    if WINS[theirs]:
+        return -1
+    if mine | theirs == FULL:
+        return 0
+    nodes += 1
+
+    q = -1
+    for bit in moves(mine, theirs):
+        q = max(q, -alphabeta(theirs, mine | bit, -beta, -alpha))
+        alpha = max(alpha, q)
+        if alpha >= beta:
+            break
+    return q
+
+
+def minimax(board):
+    """
+    Returns the optimal action for the current player on the board.
+    """
+    x, o = encode(board)
+    if WINS[x] or WINS[o] or x | o == FULL:
+        return None
+    mine, theirs = (x, o) if x.bit_count() == o.bit_count() else (o, x)
+
+    best_q = -2
+    best_move = None
+    for bit in moves(mine, theirs):
+        q = -alphabeta(theirs, mine | bit, -1, -best_q)
+        if q > best_q:
+            best_q = q
+            cell = bit.bit_length() - 1
+            best_move = (cell // 3, cell % 3)
+    return best_move
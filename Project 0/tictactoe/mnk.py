@@ -0,0 +1,275 @@
+"""
+m,n,k-game player
+
+Generalizes Tic Tac Toe to an m-by-n board where k in a row wins,
+with the same functions as tictactoe.py exposed as Game methods.
+Moves are chosen by iterative-deepening alpha-beta search with a
+heuristic evaluation and a per-move time budget.
+"""
+
+import math
+import time
+
+X = "X"
+O = "O"
+EMPTY = None
+
+# Score of a won position, minus the plies needed to reach it
+WIN = 1000000
+
+# How many nodes to expand between checks of the clock
+CLOCK_INTERVAL = 512
+
+
+class Timeout(Exception):
+    """
+    Raised inside the search when the time budget runs out.
+    """
+
+
+class Game():
+
+    X = X
+    O = O
+    EMPTY = EMPTY
+
+    def __init__(self, m=3, n=3, k=3, time_limit=1.0):
+        """
+        Initialize an m-row, n-column game won by k in a row,
+        whose AI spends at most time_limit seconds per move.
+        """
+        if k > max(m, n):
+            raise ValueError("k cannot exceed the board size")
+        self.m = m
+        self.n = n
+        self.k = k
+        self.time_limit = time_limit
+
+        # Every window of k cells in a row, column or diagonal,
+        # as tuples of flat cell indices i * n + j
+        self.lines = []
+        for i in range(m):
+            for j in range(n):
+                for di, dj in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+                    if 0 <= i + (k - 1) * di < m and 0 <= j + (k - 1) * dj < n:
+                        self.lines.append(tuple(
+                            (i + s * di) * n + (j + s * dj) for s in range(k)
+                        ))
+
+        # Windows through each cell, for checking the last move
+        self.lines_through = [[] for _ in range(m * n)]
+        for line in self.lines:
+            for cell in line:
+                self.lines_through[cell].append(line)
+
+        # Cells nearest the center first, as a default move ordering
+        center = ((m - 1) / 2, (n - 1) / 2)
+        self.order = sorted(range(m * n), key=lambda cell: (
+            abs(cell // n - center[0]) + abs(cell % n - center[1]), cell
+        ))
+
+        # Depth reached, nodes searched and speed of the last search
+        self.last_search = None
+
+    def initial_state(self):
+        """
+        Returns starting state of the board.
+        """
+        return [[EMPTY] * self.n for _ in range(self.m)]
+
+    def player(self, board):
+        """
+        Returns player who has the next turn on a board.
+        """
+        nX = sum(row.count(X) for row in board)
+        nO = sum(row.count(O) for row in board)
+        return O if nX > nO else X
+
+    def actions(self, board):
+        """
+        Returns set of all possible actions (i, j) available on the board.
+        """
+        return {(i, j) for i in range(self.m) for j in range(self.n)
+                if board[i][j] == EMPTY}
+
+    def result(self, board, action):
+        """
+        Returns the board that results from making move (i, j) on the board.
+        """
+        i, j = action
+        if not (0 <= i < self.m and 0 <= j < self.n) or board[i][j] is not EMPTY:
+            raise Exception("Invalid move")
+        nb = [row.copy() for row in board]
+        nb[i][j] = self.player(board)
+        return nb
+
+    def winner(self, board):
+        """
+        Returns the winner of the game, if there is one.
+        """
+        cells = [cell for row in board for cell in row]
+        for line in self.lines:
+            first = cells[line[0]]
+            if first is not EMPTY and all(cells[c] == first for c in line):
+                return first
+        return None
+
+    def terminal(self, board):
+        """
+        Returns True if game is over, False otherwise.
+        """
+        if self.winner(board) is not None:
+            return True
+        return all(cell is not EMPTY for row in board for cell in row)
+
+    def utility(self, board):
+        """
+        Returns 1 if X has won the game, -1 if O has won, 0 otherwise.
+        """
+        win = self.winner(board)
+        if win == X:
+            return 1
+        if win == O:
+            return -1
+        return 0
+
+    def minimax(self, board):
+        """
+        Returns the best action found for the current player on the
+        board within the time budget.
+        """
+        return self.search(board)
+
+    def search(self, board, time_limit=None):
+        """
+        Iterative-deepening alpha-beta search from the board.
+        Returns the best move of the deepest completed iteration and
+        records the depth, nodes and nodes per second in last_search.
+        """
+        if self.terminal(board):
+            return None
+        if time_limit is None:
+            time_limit = self.time_limit
+
+        color = 1 if self.player(board) == X else -1
+        cells = [1 if cell == X else -1 if cell == O else 0
+                 for row in board for cell in row]
+        empties = cells.count(0)
+
+        self.nodes = 0
+        start = time.perf_counter()
+        self.deadline = start + time_limit
+        best_move = next(cell for cell in self.order if cells[cell] == 0)
+        depth = 0
+        score = 0
+        try:
+            for limit in range(1, empties + 1):
+                score, best_move = self.root(cells, color, limit, best_move)
+                depth = limit
+
+                # Stop once the result is exact
+                if abs(score) > WIN - self.m * self.n:
+                    break
+        except Timeout:
+            pass
+
+        elapsed = time.perf_counter() - start
+        self.last_search = {
+            "depth": depth,
+            "complete": depth == empties or abs(score) > WIN - self.m * self.n,
+            "nodes": self.nodes,
+            "seconds": elapsed,
+            "nodes_per_second": self.nodes / elapsed if elapsed else 0,
+            "score": score,
+        }
+        return (best_move // self.n, best_move % self.n)
+
+    def root(self, cells, color, depth, first):
+        """
+        Searches every move at the root to depth plies, trying the
+        previous iteration's best move first.
+        Returns (score, move) for the player to move.
+        """
+        moves = [first] + [cell for cell in self.order
+                           if cells[cell] == 0 and cell != first]
+        alpha = -math.inf
+        best_move = first
+        for cell in moves:
+            cells[cell] = color
+            try:
+                q = -self.negamax(cells, -color, cell, depth - 1, 1,
+                                  -math.inf, -alpha)
+            finally:
+                cells[cell] = 0
+            if q > alpha:
+                alpha = q
+                best_move = cell
+        return alpha, best_move
+
+    def negamax(self, cells, color, last, depth, ply, alpha, beta):
+        """
+        Returns the score of the position for color, the player to
+        move, where last is the cell the opponent just played.
+        """
+        self.nodes += 1
+        if self.wins(cells, last):
+            return -(WIN - ply)
+
+        # Evaluations cost far more than reading the clock, so the
+        # clock is read before each one, and every CLOCK_INTERVAL
+        # nodes otherwise
+        if depth == 0 or 0 not in cells:
+            if time.perf_counter() > self.deadline:
+                raise Timeout
+            return color * self.evaluate(cells)
+        if self.nodes % CLOCK_INTERVAL == 0 and \
+                time.perf_counter() > self.deadline:
+            raise Timeout
+
+        q = -math.inf
+        for cell in self.order:
+            if cells[cell] != 0:
+                continue
+            cells[cell] = color
+            try:
+                q = max(q, -self.negamax(cells, -color, cell, depth - 1,
+                                         ply + 1, -beta, -alpha))
+            finally:
+                cells[cell] = 0
+            alpha = max(alpha, q)
+            if alpha >= beta:
+                break
+        return q
+
+    def wins(self, cells, last):
+        """
+        Checks whether the mark in cell last completes a line.
+        """
+        mark = cells[last]
+        for line in self.lines_through[last]:
+            if all(cells[cell] == mark for cell in line):
+                return True
+        return False
+
+    def evaluate(self, cells):
+        """
+        Heuristic score of a position from X's point of view.
+        Each window still open to only one player counts for that
+        player, weighted by how many of its cells they already hold.
+        """
+        score = 0
+        for line in self.lines:
+            total = 0
+            blocked = False
+            seen = 0
+            for cell in line:
+                mark = cells[cell]
+                if mark:
+                    if seen and mark != seen:
+                        blocked = True
+                        break
+                    seen = mark
+                    total += 1
+            if not blocked and total:
+                score += seen * 4 ** total
+        return max(-WIN // 2, min(WIN // 2, score))
@@ -0,0 +1,50 @@
+"""
+Builds solutions.bin, the table of optimal moves and values
+for every reachable Tic Tac Toe position, by live search.
+"""
+
+import time
+
+import tictactoe as ttt
+
+
+def main():
+    start = time.perf_counter()
+
+    # Search live, even if an older table exists
+    ttt.solutions = False
+
+    table = bytearray([0xFF]) * 3 ** 9
+    positions = 0
+    stack = [ttt.initial_state()]
+    while stack:
+        board = stack.pop()
+        index = ttt.solution_index(board)
+        if table[index] != 0xFF:
+            continue
+        positions += 1
+
+        if ttt.terminal(board):
+            table[index] = (ttt.utility(board) + 1) << 4 | 0x0F
+            continue
+        if ttt.player(board) == ttt.X:
+            value = ttt.max_val(board)
+        else:
+            value = ttt.min_val(board)
+        i, j = ttt.minimax(board)
+        table[index] = (value + 1) << 4 | (3 * i + j)
+
+        for action in ttt.actions(board):
+            stack.append(ttt.result(board, action))
+
+    with open(ttt.SOLUTIONS, "wb") as f:
+        f.write(ttt.SOLUTIONS_MAGIC)
+        f.write(table)
+
+    elapsed = time.perf_counter() - start
+    print(f"Solved {positions} positions in {elapsed:.2f}s, "
+          f"wrote {ttt.SOLUTIONS}")
+
+
+if __name__ == "__main__":
+    main()
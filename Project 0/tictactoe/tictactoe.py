@@ -3,12 +3,46 @@ Tic Tac Toe Player
 """
 
 import math
-import copy
+import os
 
 X = "X"
 O = "O"
 EMPTY = None
 
+# Cell orders of the board under its 8 rotations and reflections
+SYMMETRIES = [
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),
+]
+
+# Cells in the order alpha-beta search tries them: center, corners, edges
+CENTER_FIRST = [(1, 1), (0, 0), (0, 2), (2, 0), (2, 2),
+                (0, 1), (1, 0), (1, 2), (2, 1)]
+
+# Maps canonical board encodings to their minimax value,
+# or None to search without a transposition table
+transpositions = {}
+
+# Number of positions expanded by min_val and max_val
+nodes = 0
+
+# Table of optimal moves and values built by solve.py
+SOLUTIONS = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         "solutions.bin")
+
+# Identifies a solution table file
+SOLUTIONS_MAGIC = b"TTT1"
+
+# Contents of the solution table once loaded,
+# or False to always search
+solutions = None
+
 
 def initial_state():
     """
@@ -58,7 +92,7 @@ def result(board, action):
     if action[0] not in range(0, 3) or action[1] not in range(0, 3) or board[action[0]][action[1]] is not EMPTY:
         raise Exception("Invalid move")
 
-    nb = copy.deepcopy(board)
+    nb = [row.copy() for row in board]
     nb[action[0]][action[1]] = player(board)
     return nb
 
@@ -104,9 +138,10 @@ def utility(board):
     """
     Returns 1 if X has won the game, -1 if O has won, 0 otherwise.
     """
-    if winner(board) == X:
+    win = winner(board)
+    if win == X:
         return 1
-    if winner(board) == O:
+    if win == O:
         return -1
     return 0
 
@@ -118,6 +153,10 @@ def minimax(board):
     if terminal(board):
         return None
 
+    solved = solution(board)
+    if solved is not None:
+        return solved[0]
+
     if player(board) == X:
         best_q = -math.inf
         for move in actions(board):
@@ -140,13 +179,23 @@ def min_val(board):
     """
     Returns the minimum utility of the current board.
     """
+    global nodes
 
     if terminal(board):
         return utility(board)
-    
+
+    if transpositions is not None:
+        key = canonical(board)
+        if key in transpositions:
+            return transpositions[key]
+    nodes += 1
+
     q = math.inf
     for move in actions(board):
         q = min(q, max_val(result(board, move)))
+
+    if transpositions is not None:
+        transpositions[key] = q
     return q
 
 
@@ -154,11 +203,145 @@ def max_val(board):
     """
     Returns the maximum utility of the current board.
     """
+    global nodes
 
     if terminal(board):
         return utility(board)
 
+    if transpositions is not None:
+        key = canonical(board)
+        if key in transpositions:
+            return transpositions[key]
+    nodes += 1
+
     q = -math.inf
     for move in actions(board):
         q = max(q, min_val(result(board, move)))
+
+    if transpositions is not None:
+        transpositions[key] = q
     return q
+
+
+def alphabeta(board, ordering=CENTER_FIRST):
+    """
+    Returns the optimal action for the current player on the board,
+    searching with alpha-beta pruning.
+
+    Top-level moves are tried in the same order as minimax, so ties
+    are broken the same way and the same move is returned. Deeper
+    moves are tried in the given ordering of cells, or in the order
+    of actions(board) if ordering is None.
+    """
+    if terminal(board):
+        return None
+
+    # Search on a private copy that is updated in place
+    board = [row.copy() for row in board]
+    turn = player(board)
+    best_move = None
+    best_q = -math.inf if turn == X else math.inf
+    for move in actions(board):
+        board[move[0]][move[1]] = turn
+        if turn == X:
+            q = ab_value(board, O, best_q, math.inf, ordering)
+            better = q > best_q
+        else:
+            q = ab_value(board, X, -math.inf, best_q, ordering)
+            better = q < best_q
+        board[move[0]][move[1]] = EMPTY
+        if better:
+            best_q = q
+            best_move = move
+    return best_move
+
+
+def ab_value(board, turn, alpha, beta, ordering):
+    """
+    Returns the utility of the board with turn to move, exactly if it
+    lies strictly between alpha and beta, and otherwise a bound on
+    the same side of the window as the exact utility.
+    """
+    global nodes
+
+    win = winner(board)
+    if win is not None:
+        return 1 if win == X else -1
+    moves = ordering if ordering is not None else actions(board)
+    moves = [(i, j) for (i, j) in moves if board[i][j] is EMPTY]
+    if not moves:
+        return 0
+    nodes += 1
+
+    if turn == X:
+        q = -math.inf
+        for i, j in moves:
+            board[i][j] = X
+            q = max(q, ab_value(board, O, alpha, beta, ordering))
+            board[i][j] = EMPTY
+            alpha = max(alpha, q)
+            if alpha >= beta:
+                break
+    else:
+        q = math.inf
+        for i, j in moves:
+            board[i][j] = O
+            q = min(q, ab_value(board, X, alpha, beta, ordering))
+            board[i][j] = EMPTY
+            beta = min(beta, q)
+            if alpha >= beta:
+                break
+    return q
+
+
+def solution(board):
+    """
+    Returns the optimal (action, value) for the board from the
+    solution table, or None if there is no table or no entry.
+
+    The table has one byte per board, indexed by reading the cells
+    as base-3 digits (EMPTY 0, X 1, O 2). The low four bits hold the
+    action as 3 * i + j (0x0F once the game is over), the next two
+    hold the value plus one, and 0xFF marks boards that cannot be
+    reached.
+    """
+    global solutions
+
+    if solutions is None:
+        try:
+            with open(SOLUTIONS, "rb") as f:
+                data = f.read()
+        except OSError:
+            data = b""
+        if data[:len(SOLUTIONS_MAGIC)] == SOLUTIONS_MAGIC:
+            solutions = data[len(SOLUTIONS_MAGIC):]
+        else:
+            solutions = False
+    if not solutions:
+        return None
+
+    entry = solutions[solution_index(board)]
+    if entry == 0xFF:
+        return None
+    action = None if entry & 0x0F == 0x0F else divmod(entry & 0x0F, 3)
+    return action, (entry >> 4) - 1
+
+
+def solution_index(board):
+    """
+    Returns the index of the board in the solution table.
+    """
+    index = 0
+    for row in board:
+        for cell in row:
+            index = index * 3 + (0 if cell is EMPTY else 1 if cell == X else 2)
+    return index
+
+
+def canonical(board):
+    """
+    Returns a string encoding of the board that is the same
+    for every rotation and reflection of it.
+    """
+    cells = [cell or "-" for row in board for cell in row]
+    return min("".join(cells[i] for i in symmetry) for symmetry in SYMMETRIES)
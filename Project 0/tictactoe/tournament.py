@@ -0,0 +1,217 @@
+"""
+Headless self-play tournament between Tic Tac Toe engines
+
+Plays games between two engines across a process pool, recording
+outcomes, nodes searched and per-move latency, and writes a JSON
+report that can be diffed between releases.
+"""
+
+import json
+import os
+import random
+import sys
+import time
+from multiprocessing import Pool
+
+import bitboard
+import mnk
+import tictactoe as ttt
+
+# Keys for the two sides in reports, so an engine playing itself
+# keeps separate counts for each side
+SEATS = ("x", "o")
+
+
+def minimax_move(board, rng):
+    """
+    tictactoe.minimax, answering from the solution table if present.
+    """
+    ttt.transpositions = {}
+    ttt.nodes = 0
+    return ttt.minimax(board), ttt.nodes
+
+
+def search_move(board, rng):
+    """
+    tictactoe.minimax with live search and its transposition table.
+    """
+    table = ttt.solutions
+    ttt.solutions = False
+    ttt.transpositions = {}
+    ttt.nodes = 0
+    move = ttt.minimax(board)
+    ttt.solutions = table
+    return move, ttt.nodes
+
+
+def alphabeta_move(board, rng):
+    """
+    tictactoe.alphabeta with center-first move ordering.
+    """
+    ttt.nodes = 0
+    return ttt.alphabeta(board), ttt.nodes
+
+
+def bitboard_move(board, rng):
+    """
+    bitboard.minimax.
+    """
+    bitboard.nodes = 0
+    return bitboard.minimax(board), bitboard.nodes
+
+
+def mnk_move(board, rng, game=mnk.Game(3, 3, 3)):
+    """
+    The m,n,k engine on a 3x3 board with its default time budget.
+    """
+    move = game.minimax(board)
+    return move, game.last_search["nodes"]
+
+
+def random_move(board, rng):
+    """
+    A uniformly random legal move.
+    """
+    return rng.choice(sorted(ttt.actions(board))), 0
+
+
+# Maps engine names to functions returning (move, nodes searched).
+# Engines that share tictactoe's transposition table start each move
+# with an empty one, since pool workers play many games in turn and a
+# warm table would hide the nodes a search really needs.
+ENGINES = {
+    "minimax": minimax_move,
+    "search": search_move,
+    "alphabeta": alphabeta_move,
+    "bitboard": bitboard_move,
+    "mnk": mnk_move,
+    "random": random_move,
+}
+
+
+def main():
+    if len(sys.argv) < 3 or len(sys.argv) > 5 or \
+            not all(name in ENGINES for name in sys.argv[1:3]):
+        sys.exit("Usage: python tournament.py engine engine [games] [report]\n"
+                 f"Engines: {', '.join(ENGINES)}")
+    engines = sys.argv[1:3]
+    games = int(sys.argv[3]) if len(sys.argv) >= 4 else 100
+    filename = sys.argv[4] if len(sys.argv) == 5 else "report.json"
+
+    start = time.perf_counter()
+    with Pool(os.cpu_count()) as pool:
+        results = pool.starmap(
+            play_game, [(engines, game) for game in range(games)]
+        )
+    elapsed = time.perf_counter() - start
+
+    report = summarize(engines, results)
+    report["seconds"] = round(elapsed, 3)
+    with open(filename, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+    outcomes = report["outcomes"]
+    print(f"{games} games in {elapsed:.2f}s: " + ", ".join(
+        f"{name} as {seat.upper()} {wins}"
+        for seat in SEATS for name, wins in outcomes[seat].items()
+    ) + f", draws {outcomes['draw']}")
+    print(f"Report written to {filename}")
+
+
+def play_game(engines, game):
+    """
+    Plays one game, seeded by its number, with the engines taking
+    turns as X. Returns the winning seat ("x", "o" or "draw"), a dict
+    mapping each seat to the engine playing it, and a list of
+    (seat, seconds, nodes, optimal) tuples, one per move.
+    """
+    rng = random.Random(game)
+    x_engine, o_engine = engines if game % 2 == 0 else engines[::-1]
+    board = ttt.initial_state()
+    seated = {"x": x_engine, "o": o_engine}
+    moves = []
+    while not ttt.terminal(board):
+        seat = "x" if ttt.player(board) == ttt.X else "o"
+        start = time.perf_counter()
+        move, nodes = ENGINES[seated[seat]](board, rng)
+        seconds = time.perf_counter() - start
+        moves.append((seat, seconds, nodes, is_optimal(board, move)))
+        board = ttt.result(board, move)
+
+    win = ttt.winner(board)
+    if win is None:
+        return "draw", seated, moves
+    return ("x" if win == ttt.X else "o"), seated, moves
+
+
+def is_optimal(board, move):
+    """
+    Checks whether move keeps the board's game-theoretic value,
+    according to the solution table. Returns None without a table.
+    """
+    solved = ttt.solution(board)
+    after = ttt.solution(ttt.result(board, move))
+    if solved is None or after is None:
+        return None
+    return solved[1] == after[1]
+
+
+def summarize(engines, results):
+    """
+    Aggregates game results into a report of wins and, for each
+    engine in each seat, move counts, nodes and latency percentiles.
+    Both are keyed by seat and then by engine name.
+    """
+    outcomes = {seat: dict.fromkeys(engines, 0) for seat in SEATS}
+    outcomes["draw"] = 0
+    moves = {seat: {name: [] for name in engines} for seat in SEATS}
+    for winner, seated, game_moves in results:
+        if winner == "draw":
+            outcomes["draw"] += 1
+        else:
+            outcomes[winner][seated[winner]] += 1
+        for seat, seconds, nodes, optimal in game_moves:
+            moves[seat][seated[seat]].append((seconds, nodes, optimal))
+
+    report = {"engines": engines, "games": len(results), "outcomes": outcomes}
+    for seat in SEATS:
+        report[seat] = {
+            name: engine_stats(moves[seat][name]) for name in moves[seat]
+        }
+    return report
+
+
+def engine_stats(moves):
+    """
+    Summarizes (seconds, nodes, optimal) tuples for the moves of one
+    engine in one seat.
+    """
+    latencies = sorted(seconds * 1000 for seconds, _, _ in moves)
+    nodes = [nodes for _, nodes, _ in moves]
+    checked = [optimal for _, _, optimal in moves if optimal is not None]
+    return {
+        "moves": len(latencies),
+        "nodes": sum(nodes),
+        "nodes_per_move": round(sum(nodes) / max(len(nodes), 1), 1),
+        "optimal_moves": round(sum(checked) / len(checked), 4)
+        if checked else None,
+        "latency_ms": {
+            f"p{p}": round(percentile(latencies, p), 3)
+            for p in (50, 90, 99, 100)
+        },
+    }
+
+
+def percentile(values, p):
+    """
+    Returns the nearest-rank pth percentile of sorted values.
+    """
+    if not values:
+        return 0
+    rank = max(1, -(-p * len(values) // 100))
+    return values[rank - 1]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,611 @@
+import os
+import random
+import sys
+import time
+
+import tracemalloc
+
+import cnf
+import frozen
+import generator
+import logic
+import parallel
+import puzzle
+import sat
+from logic import And, Biconditional, Implication, Not, Or, Symbol
+
+
+def random_sentence(rng, symbols, depth):
+    """
+    Returns a random sentence over symbols, nested at most depth
+    connectives deep.
+    """
+    if depth == 0 or rng.random() < 0.2:
+        return rng.choice(symbols)
+    kind = rng.randrange(5)
+    if kind == 0:
+        return Not(random_sentence(rng, symbols, depth - 1))
+    if kind == 1:
+        return And(*[random_sentence(rng, symbols, depth - 1)
+                     for _ in range(rng.randint(2, 3))])
+    if kind == 2:
+        return Or(*[random_sentence(rng, symbols, depth - 1)
+                    for _ in range(rng.randint(2, 3))])
+    if kind == 3:
+        return Implication(random_sentence(rng, symbols, depth - 1),
+                           random_sentence(rng, symbols, depth - 1))
+    return Biconditional(random_sentence(rng, symbols, depth - 1),
+                         random_sentence(rng, symbols, depth - 1))
+
+
+def synthetic(count, sentences=None, seed=0):
+    """
+    Returns a random satisfiable knowledge base over count symbols,
+    and a query it entails (one of its own conjuncts), so that
+    checking it must enumerate every model.
+    """
+    rng = random.Random(seed)
+    symbols = [Symbol(f"P{i}") for i in range(count)]
+    knowledge = And(*[Or(*rng.sample(symbols, 3)) for _ in range(count)])
+    for _ in range(sentences or count):
+        knowledge.add(random_sentence(rng, symbols, 3))
+
+    # Negate the sentences false in a hidden model, which satisfies all
+    hidden = {symbol.name: rng.random() < 0.5 for symbol in symbols}
+    knowledge = And(*[
+        conjunct if conjunct.evaluate(hidden) else Not(conjunct)
+        for conjunct in knowledge.conjuncts
+    ])
+    return knowledge, knowledge.conjuncts[-1]
+
+
+def random_3sat(count, ratio=4.26, seed=0):
+    """
+    Returns a knowledge base of random 3-literal clauses over count
+    symbols, at a clause-to-symbol ratio where they are hardest.
+    """
+    rng = random.Random(seed)
+    symbols = [Symbol(f"P{i}") for i in range(count)]
+    return And(*[
+        Or(*[symbol if rng.random() < 0.5 else Not(symbol)
+             for symbol in rng.sample(symbols, 3)])
+        for _ in range(round(count * ratio))
+    ])
+
+
+def puzzles():
+    """Returns (name, knowledge, symbols) for the puzzles in puzzle.py."""
+    symbols = [puzzle.AKnight, puzzle.AKnave, puzzle.BKnight,
+               puzzle.BKnave, puzzle.CKnight, puzzle.CKnave]
+    return [
+        (f"Puzzle {i}", knowledge, symbols)
+        for i, knowledge in enumerate([puzzle.knowledge0, puzzle.knowledge1,
+                                       puzzle.knowledge2, puzzle.knowledge3])
+    ]
+
+
+def timed(check, knowledge, query):
+    """Returns the result of check(knowledge, query) and its time."""
+    start = time.perf_counter()
+    entailed = check(knowledge, query)
+    return entailed, time.perf_counter() - start
+
+
+def benchmark_cnf():
+    """
+    Compares entailment checks that evaluate the sentence objects
+    with ones that evaluate the compiled clauses.
+    """
+    print(f"{'knowledge':<12}{'symbols':>8}{'gates':>7}{'clauses':>9}"
+          f"{'objects ms':>12}{'compiled ms':>13}{'speedup':>9}")
+    cases = []
+    for name, knowledge, symbols in puzzles():
+        cases += [(name, knowledge, symbols)]
+    for count in (10, 12, 14, 16):
+        knowledge, query = synthetic(count)
+        cases.append((f"random {count}", knowledge, [query]))
+
+    # Evaluate the sentence objects one model at a time, visiting
+    # every model as the compiled check does
+    limit, prune = logic.bitset_limit, logic.prune
+    logic.bitset_limit, logic.prune = 0, False
+    for name, knowledge, queries in cases:
+        compiled = cnf.CNF(knowledge)
+        object_time = compiled_time = 0
+        for query in queries:
+            expected, elapsed = timed(logic.model_check, knowledge, query)
+            object_time += elapsed
+            entailed, elapsed = timed(cnf.model_check, knowledge, query)
+            compiled_time += elapsed
+            if entailed != expected:
+                sys.exit(f"{name}: compiled check disagrees on {query}")
+        print(f"{name:<12}{len(knowledge.symbols()):>8}"
+              f"{len(compiled.gates):>7}{len(compiled.clauses):>9}"
+              f"{object_time * 1000:>12.1f}{compiled_time * 1000:>13.1f}"
+              f"{object_time / compiled_time:>8.1f}x")
+    logic.bitset_limit, logic.prune = limit, prune
+
+
+def benchmark_sat():
+    """
+    Compares the enumerating and SAT entailment engines on random
+    knowledge bases, and times the SAT engine alone on ones too large
+    to enumerate.
+    """
+    print(f"{'knowledge':<12}{'symbols':>8}{'enumerate ms':>14}{'sat ms':>10}"
+          f"{'decisions':>11}{'conflicts':>11}")
+    cases = [(f"random {count}", *synthetic(count))
+             for count in (8, 12, 16, 20, 100, 400)]
+    for count in (12, 16, 20, 50, 100, 150):
+        knowledge = random_3sat(count)
+        cases.append((f"3-SAT {count}", knowledge, Symbol("P0")))
+
+    for name, knowledge, query in cases:
+        compiled = cnf.CNF(knowledge)
+        solver = sat.Solver(compiled)
+        start = time.perf_counter()
+        entailed = not solver.solve([-compiled.literal(query)])
+        sat_time = time.perf_counter() - start
+
+        enumerate_time = ""
+        if len(knowledge.symbols()) <= 20:
+            expected, elapsed = timed(logic.model_check, knowledge, query)
+            if entailed != expected:
+                sys.exit(f"{name}: engines disagree")
+            enumerate_time = f"{elapsed * 1000:.1f}"
+        print(f"{name:<12}{len(knowledge.symbols()):>8}{enumerate_time:>14}"
+              f"{sat_time * 1000:>10.1f}{solver.decisions:>11}"
+              f"{solver.conflicts:>11}")
+
+
+def benchmark_batch():
+    """
+    Compares the work of checking each symbol of puzzle.py's puzzles
+    separately and of checking them all in one batch, for the
+    enumerating and SAT engines.
+    """
+    print(f"{'knowledge':<12}{'models':>8}{'batch models':>14}"
+          f"{'solves':>8}{'batch solves':>14}")
+    totals = [0, 0, 0, 0]
+    for name, knowledge, symbols in puzzles():
+        logic.models = 0
+        expected = [logic.model_check(knowledge, symbol)
+                    for symbol in symbols]
+        work = [logic.models]
+        logic.models = 0
+        if logic.model_check_all(knowledge, symbols) != expected:
+            sys.exit(f"{name}: batch enumeration disagrees")
+        work.append(logic.models)
+
+        sat.solves = 0
+        for symbol, entailed in zip(symbols, expected):
+            if sat.model_check(knowledge, symbol) != entailed:
+                sys.exit(f"{name}: sat disagrees on {symbol}")
+        work.append(sat.solves)
+        sat.solves = 0
+        if sat.model_check_all(knowledge, symbols) != expected:
+            sys.exit(f"{name}: batch sat disagrees")
+        work.append(sat.solves)
+
+        totals = [total + w for total, w in zip(totals, work)]
+        print(f"{name:<12}{work[0]:>8}{work[1]:>14}"
+              f"{work[2]:>8}{work[3]:>14}")
+    print(f"{'total':<12}{totals[0]:>8}{totals[1]:>14}"
+          f"{totals[2]:>8}{totals[3]:>14}")
+
+
+def copying_check_all(knowledge, query, symbols, model):
+    """
+    The original model checker, which copies the model at every
+    branch, kept for comparison.
+    """
+    if not symbols:
+        if knowledge.evaluate(model):
+            return query.evaluate(model)
+        return True
+    remaining = symbols.copy()
+    p = remaining.pop()
+    model_true = model.copy()
+    model_true[p] = True
+    model_false = model.copy()
+    model_false[p] = False
+    return (copying_check_all(knowledge, query, remaining, model_true) and
+            copying_check_all(knowledge, query, remaining, model_false))
+
+
+def benchmark_bitset():
+    """
+    Compares checking one model at a time, by copying and by
+    in-place assignment, with evaluating the whole truth table
+    at once as bitsets.
+    """
+    print(f"{'symbols':>8}{'copying ms':>12}{'in place ms':>13}"
+          f"{'bitset ms':>11}")
+
+    # The in-place enumerator visits every model, like the copying one
+    prune = logic.prune
+    logic.prune = False
+    for count in range(10, 25, 2):
+        knowledge, query = synthetic(count)
+        symbols = sorted(set.union(knowledge.symbols(), query.symbols()))
+
+        row = ""
+        if count <= 18:
+            start = time.perf_counter()
+            expected = copying_check_all(knowledge, query, set(symbols), {})
+            row += f"{(time.perf_counter() - start) * 1000:>12.1f}"
+            start = time.perf_counter()
+            if logic.check_all(knowledge, query, symbols, {}) != expected:
+                sys.exit(f"random {count}: in-place check disagrees")
+            row += f"{(time.perf_counter() - start) * 1000:>13.1f}"
+        else:
+            expected = True
+            row += f"{'':>12}{'':>13}"
+
+        start = time.perf_counter()
+        columns, mask = logic.truth_table(symbols)
+        entailed = not (knowledge.bitset(columns, mask)
+                        & ~query.bitset(columns, mask))
+        if entailed != expected:
+            sys.exit(f"random {count}: bitset check disagrees")
+        row += f"{(time.perf_counter() - start) * 1000:>11.1f}"
+        print(f"{count:>8}" + row)
+    logic.prune = prune
+
+
+def pairwise(n, Symbol, Not, And, Or, Biconditional):
+    """
+    Builds a knowledge base in which each of n inhabitants says of
+    every other that they are a knight or a knave but not both,
+    from the given sentence constructors.
+    """
+    knights = [Symbol(f"{i} is a Knight") for i in range(n)]
+    knaves = [Symbol(f"{i} is a Knave") for i in range(n)]
+    knowledge = []
+    for i in range(n):
+        knowledge.append(Or(knights[i], knaves[i]))
+        knowledge.append(Not(And(knights[i], knaves[i])))
+    for i in range(n):
+        for j in range(n):
+            if i != j:
+                knowledge.append(Biconditional(knights[i], And(
+                    Or(knights[j], knaves[j]),
+                    Not(And(knights[j], knaves[j]))
+                )))
+    return And(*knowledge)
+
+
+def benchmark_frozen():
+    """
+    Compares building a large knowledge base, and hashing it and
+    collecting its symbols, with ordinary and frozen sentences.
+    """
+    variants = [
+        ("ordinary", (Symbol, Not, And, Or, Biconditional)),
+        ("frozen", (frozen.FrozenSymbol, frozen.FrozenNot,
+                    frozen.FrozenAnd, frozen.FrozenOr,
+                    frozen.FrozenBiconditional)),
+    ]
+    print(f"{'inhabitants':>11}{'variant':>10}{'build ms':>10}"
+          f"{'memory KB':>11}{'hash ms':>9}{'symbols ms':>12}")
+    for n in (25, 50, 100):
+        results = []
+        for name, constructors in variants:
+            tracemalloc.start()
+            start = time.perf_counter()
+            knowledge = pairwise(n, *constructors)
+            build_time = time.perf_counter() - start
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            start = time.perf_counter()
+            for _ in range(10):
+                hashed = hash(knowledge)
+            hash_time = time.perf_counter() - start
+            start = time.perf_counter()
+            for _ in range(10):
+                symbols = knowledge.symbols()
+            symbols_time = time.perf_counter() - start
+            results.append((hashed, symbols, knowledge))
+            print(f"{n:>11}{name:>10}{build_time * 1000:>10.1f}"
+                  f"{memory // 1024:>11}{hash_time * 1000:>9.2f}"
+                  f"{symbols_time * 1000:>12.2f}")
+        if results[0] != results[1]:
+            sys.exit("Frozen knowledge base differs from the ordinary one.")
+
+
+def benchmark_parallel():
+    """
+    Times partitioned enumeration with 1, 2, 4 and 8 worker processes
+    on entailed queries, which must check every chunk, and on a query
+    with counterexamples, where the first one found stops the rest.
+    """
+    print(f"{os.cpu_count()} CPUs")
+    print(f"{'symbols':>8}{'query':>10}{'serial ms':>11}" + "".join(
+        f"{f'{workers} workers ms':>16}" for workers in (1, 2, 4, 8)))
+    for count in (20, 24, 28):
+        knowledge, query = synthetic(count)
+        for kind, q in (("entailed", query), ("refuted", Not(query))):
+            row = f"{count:>8}{kind:>10}"
+            expected = kind == "entailed"
+            if count <= logic.bitset_limit:
+                entailed, elapsed = timed(logic.model_check, knowledge, q)
+                if entailed != expected:
+                    sys.exit(f"random {count}: serial check is wrong")
+                row += f"{elapsed * 1000:>11.1f}"
+            else:
+                row += f"{'':>11}"
+            for workers in (1, 2, 4, 8):
+                start = time.perf_counter()
+                entailed = parallel.model_check(knowledge, q, workers=workers)
+                if entailed != expected:
+                    sys.exit(f"random {count}: parallel check is wrong")
+                row += f"{(time.perf_counter() - start) * 1000:>16.1f}"
+            print(row)
+
+
+def leaves(knowledge, queries):
+    """
+    Checks each query by enumeration, one model at a time.
+    Returns the results, complete models visited and time.
+    """
+    logic.models = 0
+    start = time.perf_counter()
+    results = [logic.model_check(knowledge, query) for query in queries]
+    return results, logic.models, time.perf_counter() - start
+
+
+def benchmark_prune():
+    """
+    Compares the models visited by enumeration with and without
+    pruning on partial models, on puzzle.py's puzzles and on
+    random knowledge bases.
+    """
+    cases = puzzles()
+    for n in (3, 4, 6, 8):
+        knowledge, symbols, _, _ = generator.generate(n, 2 * n, seed=n)
+        cases.append((f"generated {n}", knowledge, symbols))
+    for count in (12, 14, 16, 18, 20):
+        knowledge, query = synthetic(count)
+        queries = [query, Not(query), Symbol("P0"), Symbol("P1")]
+        cases.append((f"random {count}", knowledge, queries))
+
+    limit, prune = logic.bitset_limit, logic.prune
+    logic.bitset_limit = 0
+    print(f"{'knowledge':<12}{'leaves':>10}{'pruned leaves':>15}"
+          f"{'ms':>10}{'pruned ms':>11}")
+    for name, knowledge, queries in cases:
+        logic.prune = False
+        expected, full, full_time = leaves(knowledge, queries)
+        logic.prune = True
+        results, pruned, pruned_time = leaves(knowledge, queries)
+        if results != expected:
+            sys.exit(f"{name}: pruning changed the result")
+        print(f"{name:<12}{full:>10}{pruned:>15}"
+              f"{full_time * 1000:>10.1f}{pruned_time * 1000:>11.1f}")
+    logic.bitset_limit, logic.prune = limit, prune
+
+
+def benchmark_scaling(budget=2.0):
+    """
+    Times solving generated puzzles, with twice as many statements as
+    inhabitants, against the number of inhabitants for each backend.
+    The enumerating backends are dropped once their time, doubling
+    with each symbol, would exceed budget seconds.
+    """
+    def enumerate_all(knowledge, symbols):
+        return [logic.model_check(knowledge, symbol) for symbol in symbols]
+
+    def compiled_all(knowledge, symbols):
+        return [cnf.model_check(knowledge, symbol) for symbol in symbols]
+
+    def parallel_all(knowledge, symbols):
+        return [parallel.model_check(knowledge, symbol)
+                for symbol in symbols]
+
+    backends = {
+        "enumerate": enumerate_all,
+        "batch": logic.model_check_all,
+        "compiled": compiled_all,
+        "parallel": parallel_all,
+        "sat": sat.model_check_all,
+    }
+    print(f"{'inhabitants':>11}{'symbols':>8}" + "".join(
+        f"{name + ' ms':>14}" for name in backends))
+    last = {}
+    for n in (2, 3, 4, 6, 8, 10, 12, 16, 24, 32, 64, 128, 256):
+        knowledge, symbols, _, solution = generator.generate(n, 2 * n, n)
+        row = f"{n:>11}{len(symbols):>8}"
+        results = []
+        for name, backend in backends.items():
+            if name in last and name != "sat":
+                count, elapsed = last[name]
+                if elapsed * 2 ** (len(symbols) - count) > budget:
+                    last[name] = (count, budget)
+                    row += f"{'':>14}"
+                    continue
+            start = time.perf_counter()
+            results.append(backend(knowledge, symbols))
+            elapsed = time.perf_counter() - start
+            last[name] = (len(symbols), elapsed)
+            row += f"{elapsed * 1000:>14.1f}"
+        print(row)
+
+        # Every backend agrees, and only the solution's facts are known
+        for result in results:
+            if result != results[0]:
+                sys.exit(f"{n} inhabitants: backends disagree")
+        for symbol, known in zip(symbols, results[0]):
+            if known and not solution[symbol.name]:
+                sys.exit(f"{n} inhabitants: entailed {symbol} is false")
+
+
+def benchmark_incremental():
+    """
+    Compares an agent that adds a generated puzzle's statements one
+    at a time, asking about every symbol after each, when solving
+    from scratch each time and with one incremental knowledge base.
+    """
+    print(f"{'inhabitants':>11}{'statements':>12}{'scratch ms':>12}"
+          f"{'incremental ms':>16}{'speedup':>9}")
+    for n in (8, 16, 32, 64):
+        puzzle_knowledge, symbols, _, _ = generator.generate(n, 2 * n, n)
+        rules = puzzle_knowledge.conjuncts[:2 * n]
+        statements = puzzle_knowledge.conjuncts[2 * n:]
+
+        knowledge = And(*rules)
+        start = time.perf_counter()
+        expected = []
+        for statement in statements:
+            knowledge.add(statement)
+            expected.append(sat.model_check_all(knowledge, symbols))
+        scratch_time = time.perf_counter() - start
+
+        knowledge = And(*rules)
+        start = time.perf_counter()
+        base = sat.KnowledgeBase(knowledge)
+        results = []
+        for statement in statements:
+            knowledge.add(statement)
+            results.append(base.ask_all(symbols))
+        incremental_time = time.perf_counter() - start
+
+        if results != expected:
+            sys.exit(f"{n} inhabitants: incremental answers differ")
+        print(f"{n:>11}{len(statements):>12}{scratch_time * 1000:>12.1f}"
+              f"{incremental_time * 1000:>16.1f}"
+              f"{scratch_time / incremental_time:>8.1f}x")
+
+
+def verify(trials=2000, seed=0):
+    """
+    Checks that the compiled and SAT engines agree with enumeration
+    on random knowledge bases and queries.
+    """
+    rng = random.Random(seed)
+    entailed = 0
+    for trial in range(trials):
+        symbols = [Symbol(f"P{i}") for i in range(rng.randint(1, 7))]
+        knowledge = And(*[random_sentence(rng, symbols, 3)
+                          for _ in range(rng.randint(1, 4))])
+        query = random_sentence(rng, symbols, 2)
+        expected = logic.model_check(knowledge, query)
+        entailed += expected
+        frozen_knowledge = frozen.freeze(knowledge)
+        if frozen_knowledge != knowledge or knowledge != frozen_knowledge \
+                or hash(frozen_knowledge) != hash(knowledge) \
+                or frozen_knowledge.symbols() != knowledge.symbols():
+            sys.exit(f"frozen copy differs: {knowledge.formula()}")
+        if logic.model_check(frozen_knowledge, query) != expected:
+            sys.exit(f"frozen knowledge base disagrees: "
+                     f"{knowledge.formula()} entails {query.formula()}")
+        names = sorted(set.union(knowledge.symbols(), query.symbols()))
+        for prune in (False, True):
+            logic.prune = prune
+            if logic.check_all(knowledge, query, names, {}) != expected:
+                sys.exit(f"bitset and model enumeration disagree: "
+                         f"{knowledge.formula()} entails {query.formula()}")
+        for engine in (cnf, sat):
+            if engine.model_check(knowledge, query) != expected:
+                sys.exit(f"{engine.__name__} disagrees with enumeration: "
+                         f"{knowledge.formula()} entails {query.formula()} "
+                         f"is {expected}")
+
+        queries = [query] + [random_sentence(rng, symbols, 2)
+                             for _ in range(rng.randint(0, 4))]
+        expected = [logic.model_check(knowledge, q) for q in queries]
+        for engine in (logic, sat):
+            if engine.model_check_all(knowledge, queries) != expected:
+                sys.exit(f"{engine.__name__} batch check disagrees with "
+                         f"single checks on {knowledge.formula()}")
+    print(f"bitset, frozen, cnf, sat and batch checks agree with enumeration "
+          f"on {trials} random checks ({entailed} entailed).")
+
+    # Partitioned enumeration, with a few symbols fixed per chunk
+    for trial in range(trials // 40):
+        knowledge, query = synthetic(8 + trial % 5, seed=trial)
+        for q in (query, Not(query), Symbol("P0")):
+            expected = logic.model_check(knowledge, q)
+            split = trial % 4
+            if parallel.model_check(knowledge, q, 2, split) != expected:
+                sys.exit(f"parallel check disagrees on synthetic {trial}")
+    print(f"parallel checks agree with enumeration on {trials // 40 * 3} "
+          f"synthetic checks.")
+
+    # Generated puzzles, whose solutions must satisfy them
+    for trial in range(trials // 20):
+        n = 1 + trial % 6
+        knowledge, symbols, _, solution = generator.generate(n, n, trial)
+        if not knowledge.evaluate(solution):
+            sys.exit(f"generated puzzle {trial} contradicts its solution")
+        expected = [logic.model_check(knowledge, s) for s in symbols]
+        if sat.model_check_all(knowledge, symbols) != expected:
+            sys.exit(f"sat disagrees on generated puzzle {trial}")
+    print(f"sat agrees with enumeration on {trials // 20} generated "
+          f"puzzles.")
+
+    # Knowledge bases told one sentence at a time, following an And
+    for trial in range(trials // 20):
+        rng = random.Random(trial)
+        symbols = [Symbol(f"P{i}") for i in range(rng.randint(1, 6))]
+        knowledge = And()
+        base = sat.KnowledgeBase(knowledge)
+        for _ in range(4):
+            knowledge.add(random_sentence(rng, symbols, 3))
+            queries = [random_sentence(rng, symbols, 2) for _ in range(3)]
+            expected = [logic.model_check(knowledge, q) for q in queries]
+            if base.ask_all(queries) != expected or \
+                    base.ask(queries[0]) != expected[0]:
+                sys.exit(f"incremental knowledge base disagrees on {trial}")
+    print(f"incremental knowledge bases agree with enumeration on "
+          f"{trials // 20} sequences.")
+
+    # Harder instances, where the solver must learn clauses
+    satisfiable = 0
+    for trial in range(trials // 10):
+        knowledge = random_3sat(12, seed=trial)
+        query = Symbol(f"P{trial % 12}")
+        expected = logic.model_check(knowledge, query)
+        compiled = cnf.CNF(knowledge)
+        solver = sat.Solver(compiled)
+        if solver.solve([-compiled.literal(query)]) == expected:
+            sys.exit(f"sat disagrees with enumeration on 3-SAT {trial}")
+        if solver.model is not None:
+            satisfiable += 1
+            model = {name: solver.model[v]
+                     for name, v in compiled.variables.items()}
+            if not knowledge.evaluate(model) or query.evaluate(model):
+                sys.exit(f"sat returned a wrong model on 3-SAT {trial}")
+    print(f"sat agrees with enumeration on {trials // 10} random 3-SAT "
+          f"checks ({satisfiable} with counterexamples).")
+
+
+def main():
+    commands = ("cnf", "sat", "batch", "bitset", "frozen", "parallel",
+                "prune", "scaling", "incremental", "verify")
+    if len(sys.argv) != 2 or sys.argv[1] not in commands:
+        sys.exit(f"Usage: python benchmark.py {'|'.join(commands)}")
+    if sys.argv[1] == "cnf":
+        benchmark_cnf()
+    elif sys.argv[1] == "sat":
+        benchmark_sat()
+    elif sys.argv[1] == "batch":
+        benchmark_batch()
+    elif sys.argv[1] == "bitset":
+        benchmark_bitset()
+    elif sys.argv[1] == "frozen":
+        benchmark_frozen()
+    elif sys.argv[1] == "parallel":
+        benchmark_parallel()
+    elif sys.argv[1] == "prune":
+        benchmark_prune()
+    elif sys.argv[1] == "scaling":
+        benchmark_scaling()
+    elif sys.argv[1] == "incremental":
+        benchmark_incremental()
+    elif sys.argv[1] == "verify":
+        verify()
+
+
+if __name__ == "__main__":
+    main()
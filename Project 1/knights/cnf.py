@@ -0,0 +1,238 @@
+from logic import And, Biconditional, Implication, Not, Or, Symbol
+
+# Gate types, each defining an auxiliary variable from literals
+AND = 0
+OR = 1
+IFF = 2
+
+
+class CNF():
+    """
+    Sentences compiled to conjunctive normal form.
+
+    Variables are numbered from 1 and a literal is a variable or its
+    negation, as in DIMACS files. Every compound subformula gets an
+    auxiliary variable defined by a gate (Tseitin encoding), so the
+    clauses grow linearly with the size of the sentences.
+    """
+
+    def __init__(self, *sentences):
+        # Variable numbers of symbol names, and names of variables
+        self.variables = {}
+        self.names = [None]
+
+        # Number of variables, including auxiliaries
+        self.count = 0
+
+        # Clauses defining the gates and asserting the sentences
+        self.clauses = []
+
+        # Gates as (variable, type, literals), in order of definition
+        self.gates = []
+
+        # Clauses asserting the sentences, over symbols and gates
+        self.roots = []
+
+        # Literals of compiled subformulas
+        self.literals = {}
+
+        for sentence in sentences:
+            self.add(sentence)
+
+    def variable(self, name):
+        """Returns the variable of a symbol name, creating it if new."""
+        if name not in self.variables:
+            self.count += 1
+            self.variables[name] = self.count
+            self.names.append(name)
+        return self.variables[name]
+
+    def symbols(self):
+        """Returns the set of symbol names compiled so far."""
+        return set(self.variables)
+
+    def add(self, sentence):
+        """Asserts a sentence, adding its clauses."""
+        if isinstance(sentence, And):
+            for conjunct in sentence.conjuncts:
+                self.add(conjunct)
+        elif isinstance(sentence, Or):
+            self.assert_clause([self.literal(disjunct)
+                                for disjunct in sentence.disjuncts])
+        elif isinstance(sentence, Implication):
+            self.assert_clause([-self.literal(sentence.antecedent),
+                                self.literal(sentence.consequent)])
+        else:
+            self.assert_clause([self.literal(sentence)])
+
+    def assert_clause(self, clause):
+        """Adds a clause that must hold, over any literals."""
+        self.roots.append(clause)
+        self.clauses.append(clause)
+
+    def literal(self, sentence):
+        """
+        Returns a literal equivalent to sentence,
+        defining gates for it and its subformulas as needed.
+        """
+        if isinstance(sentence, Symbol):
+            return self.variable(sentence.name)
+        if isinstance(sentence, Not):
+            return -self.literal(sentence.operand)
+        if sentence in self.literals:
+            return self.literals[sentence]
+
+        if isinstance(sentence, And):
+            literal = self.gate(AND, [self.literal(conjunct)
+                                      for conjunct in sentence.conjuncts])
+        elif isinstance(sentence, Or):
+            literal = self.gate(OR, [self.literal(disjunct)
+                                     for disjunct in sentence.disjuncts])
+        elif isinstance(sentence, Implication):
+            literal = self.gate(OR, [-self.literal(sentence.antecedent),
+                                     self.literal(sentence.consequent)])
+        elif isinstance(sentence, Biconditional):
+            literal = self.gate(IFF, [self.literal(sentence.left),
+                                      self.literal(sentence.right)])
+        else:
+            raise TypeError("must be a logical sentence")
+        self.literals[sentence] = literal
+        return literal
+
+    def gate(self, kind, literals):
+        """Defines a new variable as a gate over literals."""
+        self.count += 1
+        g = self.count
+        self.names.append(None)
+        self.gates.append((g, kind, literals))
+
+        if kind == AND:
+            # g => each literal, and all literals => g
+            for literal in literals:
+                self.clauses.append([-g, literal])
+            self.clauses.append([g] + [-literal for literal in literals])
+        elif kind == OR:
+            # g => some literal, and each literal => g
+            self.clauses.append([-g] + literals)
+            for literal in literals:
+                self.clauses.append([g, -literal])
+        else:
+            a, b = literals
+            self.clauses += [[-g, -a, b], [-g, a, -b], [g, a, b], [g, -a, -b]]
+        return g
+
+    def values(self, model):
+        """
+        Returns a list of truth values indexed by literal, so that
+        values[v] and values[-v] hold v and its negation, for a model
+        mapping symbol names to booleans.
+        """
+        values = [False] * (2 * self.count + 1)
+        for name, v in self.variables.items():
+            values[v] = bool(model[name])
+            values[-v] = not values[v]
+        self.compute(values)
+        return values
+
+    def compute(self, values):
+        """Fills in the values of the gates from those of the symbols."""
+        get = values.__getitem__
+        for g, kind, literals in self.gates:
+            if kind == AND:
+                value = all(map(get, literals))
+            elif kind == OR:
+                value = any(map(get, literals))
+            else:
+                value = values[literals[0]] == values[literals[1]]
+            values[g] = value
+            values[-g] = not value
+
+    def satisfied(self, values):
+        """Checks whether every asserted clause holds under values."""
+        get = values.__getitem__
+        return all(any(map(get, clause)) for clause in self.roots)
+
+    def evaluate(self, model):
+        """Evaluates the compiled sentences in a model."""
+        try:
+            return self.satisfied(self.values(model))
+        except KeyError as e:
+            raise Exception(f"variable {e.args[0]} not in model")
+
+
+def model_check(knowledge, query):
+    """
+    Checks if knowledge base entails query, enumerating models
+    over the compiled form instead of the sentence objects.
+
+    Models are visited in Gray code order, so each differs from the
+    last in one symbol, and only the gates and clauses that depend on
+    that symbol are updated.
+    """
+    compiled = CNF(knowledge)
+    q = compiled.literal(query)
+    symbols = [compiled.variables[name] for name in
+               sorted(set.union(knowledge.symbols(), query.symbols()))]
+
+    # Start from the model where every symbol is false
+    values = [False] * (2 * compiled.count + 1)
+    for v in range(1, compiled.count + 1):
+        values[-v] = True
+    compiled.compute(values)
+
+    # For each variable, the gates and asserted clauses it occurs in,
+    # as (gate or None, clause index or None, literal)
+    uses = [[] for _ in range(compiled.count + 1)]
+    kinds = {}
+    counts = {}
+    for g, kind, literals in compiled.gates:
+        kinds[g] = kind
+        for literal in literals:
+            uses[abs(literal)].append((g, None, literal))
+        if kind == AND:
+            counts[g] = sum(not values[literal] for literal in literals)
+        elif kind == OR:
+            counts[g] = sum(values[literal] for literal in literals)
+        else:
+            counts[g] = literals
+    satisfied = []
+    for i, clause in enumerate(compiled.roots):
+        for literal in clause:
+            uses[abs(literal)].append((None, i, literal))
+        satisfied.append(sum(values[literal] for literal in clause))
+    unsatisfied = satisfied.count(0)
+
+    def flip(v):
+        """Flips variable v and updates everything that uses it."""
+        nonlocal unsatisfied
+        values[v] = not values[v]
+        values[-v] = not values[v]
+        for g, i, literal in uses[v]:
+            true = values[literal]
+            if g is None:
+                satisfied[i] += 1 if true else -1
+                if satisfied[i] == 0:
+                    unsatisfied += 1
+                elif true and satisfied[i] == 1:
+                    unsatisfied -= 1
+                continue
+
+            kind = kinds[g]
+            if kind == AND:
+                counts[g] += -1 if true else 1
+                value = counts[g] == 0
+            elif kind == OR:
+                counts[g] += 1 if true else -1
+                value = counts[g] > 0
+            else:
+                a, b = counts[g]
+                value = values[a] == values[b]
+            if value != values[g]:
+                flip(g)
+
+    for i in range(1 << len(symbols)):
+        if i:
+            flip(symbols[(i & -i).bit_length() - 1])
+        if not unsatisfied and not values[q]:
+            return False
+    return True
@@ -0,0 +1,257 @@
+import weakref
+
+from logic import And, Biconditional, Implication, Not, Or, Sentence, Symbol
+
+# Fewest entries an intern table holds before dead ones are purged
+PURGE_SIZE = 1024
+
+
+def freeze(sentence):
+    """
+    Returns the frozen sentence equal to sentence, which may mix
+    frozen and ordinary parts.
+    """
+    if isinstance(sentence, Frozen):
+        return sentence
+    if isinstance(sentence, Symbol):
+        return FrozenSymbol(sentence.name)
+    if isinstance(sentence, Not):
+        return FrozenNot(sentence.operand)
+    if isinstance(sentence, And):
+        return FrozenAnd(*sentence.conjuncts)
+    if isinstance(sentence, Or):
+        return FrozenOr(*sentence.disjuncts)
+    if isinstance(sentence, Implication):
+        return FrozenImplication(sentence.antecedent, sentence.consequent)
+    if isinstance(sentence, Biconditional):
+        return FrozenBiconditional(sentence.left, sentence.right)
+    Sentence.validate(sentence)
+    raise TypeError(f"cannot freeze {type(sentence).__name__}")
+
+
+def key_for(parts):
+    """
+    Returns the intern key for a tuple of frozen parts: an integer
+    packing the identities of two parts, the commonest case, and a
+    tuple of identities otherwise.
+    """
+    if len(parts) == 2:
+        return id(parts[0]) << 64 | id(parts[1])
+    return tuple(map(id, parts))
+
+
+def intern(cls, key, *values):
+    """
+    Creates a sentence of type cls with its fields set to values,
+    and interns it with key. Constructors look in cls.live first,
+    so only new sentences are created here.
+    """
+    sentence = object.__new__(cls)
+    for field, value in zip(cls.fields, values):
+        field.__set__(sentence, value)
+    cls._hash.__set__(sentence, None)
+    cls._symbols.__set__(sentence, None)
+    if len(cls.live) >= cls.purge_size:
+        purge(cls)
+    cls.live[key] = weakref.ref(sentence)
+    return sentence
+
+
+def purge(cls):
+    """
+    Drops the entries of sentences that no longer exist from the
+    intern table of cls, and lets it grow to twice its size before
+    the next purge, so purging takes constant time per sentence.
+    """
+    live = cls.live
+    for key in [key for key, ref in live.items() if ref() is None]:
+        del live[key]
+    cls.purge_size = max(PURGE_SIZE, 2 * len(live))
+
+
+class Frozen():
+    """
+    Behavior shared by the frozen sentence types.
+
+    Frozen sentences are immutable and hash-consed: constructing one
+    equal to a live frozen sentence returns that sentence, so shared
+    subformulas are stored once and equality of frozen sentences is
+    identity. Hashes and symbol sets are computed once, on first use.
+    They compare and hash equal to the ordinary sentences they mirror.
+
+    Each type interns its sentences in its own table, live, which
+    maps the name of a symbol or the identities of a sentence's (also
+    interned) parts to a weak reference to the sentence. An entry
+    whose sentence has died never matches a live sentence, since the
+    parts it names died too, and is purged as the table grows.
+    """
+
+    __slots__ = ()
+
+    # Construction is done by __new__, and skipping __init__ keeps
+    # the lookup of an existing sentence cheap
+    __init__ = object.__init__
+
+    def __setattr__(self, name, value):
+        raise AttributeError("frozen sentences are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("frozen sentences are immutable")
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, Frozen):
+            return False
+        return super().__eq__(other)
+
+    def __reduce__(self):
+        # Pickle by construction, so unpickling interns the sentence
+        return (type(self), tuple(self.parts()))
+
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, "_hash", super().__hash__())
+        return self._hash
+
+    def symbols(self):
+        return set(self.symbol_set())
+
+    def symbol_set(self):
+        """Returns the frozenset of symbols, computing it once."""
+        if self._symbols is None:
+            object.__setattr__(self, "_symbols", frozenset().union(
+                *[part.symbol_set() for part in self.parts()]
+            ))
+        return self._symbols
+
+    def parts(self):
+        """Returns the sentences this one is built from."""
+        return ()
+
+
+class FrozenSymbol(Frozen, Symbol):
+
+    __slots__ = ("_hash", "_symbols", "__weakref__")
+    live = {}
+    purge_size = PURGE_SIZE
+    fields = (Symbol.name,)
+
+    def __new__(cls, name):
+        ref = cls.live.get(name)
+        sentence = ref and ref()
+        return sentence or intern(cls, name, name)
+
+    def __reduce__(self):
+        return (type(self), (self.name,))
+
+    def symbol_set(self):
+        if self._symbols is None:
+            object.__setattr__(self, "_symbols", frozenset((self.name,)))
+        return self._symbols
+
+
+class FrozenNot(Frozen, Not):
+
+    __slots__ = ("_hash", "_symbols", "__weakref__")
+    live = {}
+    purge_size = PURGE_SIZE
+    fields = (Not.operand,)
+
+    def __new__(cls, operand):
+        if not isinstance(operand, Frozen):
+            operand = freeze(operand)
+        key = id(operand)
+        ref = cls.live.get(key)
+        sentence = ref and ref()
+        return sentence or intern(cls, key, operand)
+
+    def parts(self):
+        return (self.operand,)
+
+
+class FrozenAnd(Frozen, And):
+
+    __slots__ = ("_hash", "_symbols", "__weakref__")
+    live = {}
+    purge_size = PURGE_SIZE
+    fields = (And.conjuncts,)
+
+    def __new__(cls, *conjuncts):
+        for conjunct in conjuncts:
+            if not isinstance(conjunct, Frozen):
+                conjuncts = tuple(map(freeze, conjuncts))
+                break
+        key = key_for(conjuncts)
+        ref = cls.live.get(key)
+        sentence = ref and ref()
+        return sentence or intern(cls, key, conjuncts)
+
+    def add(self, conjunct):
+        raise TypeError("frozen sentences are immutable")
+
+    def parts(self):
+        return self.conjuncts
+
+
+class FrozenOr(Frozen, Or):
+
+    __slots__ = ("_hash", "_symbols", "__weakref__")
+    live = {}
+    purge_size = PURGE_SIZE
+    fields = (Or.disjuncts,)
+
+    def __new__(cls, *disjuncts):
+        for disjunct in disjuncts:
+            if not isinstance(disjunct, Frozen):
+                disjuncts = tuple(map(freeze, disjuncts))
+                break
+        key = key_for(disjuncts)
+        ref = cls.live.get(key)
+        sentence = ref and ref()
+        return sentence or intern(cls, key, disjuncts)
+
+    def parts(self):
+        return self.disjuncts
+
+
+class FrozenImplication(Frozen, Implication):
+
+    __slots__ = ("_hash", "_symbols", "__weakref__")
+    live = {}
+    purge_size = PURGE_SIZE
+    fields = (Implication.antecedent, Implication.consequent)
+
+    def __new__(cls, antecedent, consequent):
+        if not isinstance(antecedent, Frozen):
+            antecedent = freeze(antecedent)
+        if not isinstance(consequent, Frozen):
+            consequent = freeze(consequent)
+        key = id(antecedent) << 64 | id(consequent)
+        ref = cls.live.get(key)
+        sentence = ref and ref()
+        return sentence or intern(cls, key, antecedent, consequent)
+
+    def parts(self):
+        return (self.antecedent, self.consequent)
+
+
+class FrozenBiconditional(Frozen, Biconditional):
+
+    __slots__ = ("_hash", "_symbols", "__weakref__")
+    live = {}
+    purge_size = PURGE_SIZE
+    fields = (Biconditional.left, Biconditional.right)
+
+    def __new__(cls, left, right):
+        if not isinstance(left, Frozen):
+            left = freeze(left)
+        if not isinstance(right, Frozen):
+            right = freeze(right)
+        key = id(left) << 64 | id(right)
+        ref = cls.live.get(key)
+        sentence = ref and ref()
+        return sentence or intern(cls, key, left, right)
+
+    def parts(self):
+        return (self.left, self.right)
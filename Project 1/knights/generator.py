@@ -0,0 +1,90 @@
+import random
+import sys
+
+from logic import And, Biconditional, Not, Or, Symbol, model_check_all
+
+
+def name(i):
+    """Returns the name of inhabitant i: A to Z, then numbered."""
+    return chr(ord("A") + i) if i < 26 else f"I{i}"
+
+
+def generate(n, m, seed=None):
+    """
+    Returns a random knights-and-knaves puzzle with n inhabitants who
+    make m statements in total, as (knowledge, symbols, statements,
+    solution). symbols lists each inhabitant's knight and knave
+    symbols, statements describes each statement in words, and
+    solution is a model of the knowledge base that the statements
+    were made consistent with.
+    """
+    rng = random.Random(seed)
+    knights = [Symbol(f"{name(i)} is a Knight") for i in range(n)]
+    knaves = [Symbol(f"{name(i)} is a Knave") for i in range(n)]
+    kinds = [rng.random() < 0.5 for _ in range(n)]
+    solution = {}
+    for i in range(n):
+        solution[knights[i].name] = kinds[i]
+        solution[knaves[i].name] = not kinds[i]
+
+    # Each inhabitant is either a knight or a knave, but not both
+    knowledge = And()
+    for i in range(n):
+        knowledge.add(Or(knights[i], knaves[i]))
+        knowledge.add(Not(And(knights[i], knaves[i])))
+
+    # A statement is true if and only if its speaker is a knight,
+    # so claims a speaker could not make are negated
+    statements = []
+    for _ in range(m):
+        speaker = rng.randrange(n)
+        claim, text = random_claim(rng, n, knights, knaves)
+        if claim.evaluate(solution) != kinds[speaker]:
+            claim, text = Not(claim), f"It is not true that {text}"
+        knowledge.add(Biconditional(knights[speaker], claim))
+        statements.append(f'{name(speaker)} says "{text}."')
+
+    symbols = [symbol for pair in zip(knights, knaves) for symbol in pair]
+    return knowledge, symbols, statements, solution
+
+
+def random_claim(rng, n, knights, knaves):
+    """Returns a random claim about one or two inhabitants, in words."""
+    x = rng.randrange(n)
+    y = rng.choice([i for i in range(n) if i != x]) if n > 1 else x
+    kind = rng.randrange(6)
+    if kind == 0:
+        return knights[x], f"{name(x)} is a knight"
+    if kind == 1:
+        return knaves[x], f"{name(x)} is a knave"
+    if kind == 2:
+        return (Or(And(knights[x], knights[y]), And(knaves[x], knaves[y])),
+                f"{name(x)} and {name(y)} are the same kind")
+    if kind == 3:
+        return (Or(And(knights[x], knaves[y]), And(knaves[x], knights[y])),
+                f"{name(x)} and {name(y)} are of different kinds")
+    if kind == 4:
+        return (Or(knaves[x], knaves[y]),
+                f"at least one of {name(x)} and {name(y)} is a knave")
+    return (Biconditional(knights[x], knaves[y]),
+            f"{name(x)} is a knight if and only if {name(y)} is a knave")
+
+
+def main():
+    if len(sys.argv) not in [3, 4]:
+        sys.exit("Usage: python generator.py inhabitants statements [seed]")
+    n = int(sys.argv[1])
+    m = int(sys.argv[2])
+    seed = int(sys.argv[3]) if len(sys.argv) == 4 else None
+
+    knowledge, symbols, statements, solution = generate(n, m, seed)
+    for statement in statements:
+        print(statement)
+    print("Solution")
+    for symbol, known in zip(symbols, model_check_all(knowledge, symbols)):
+        if known:
+            print(f"    {symbol}")
+
+
+if __name__ == "__main__":
+    main()
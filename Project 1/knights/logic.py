@@ -1,12 +1,45 @@
 import itertools
 
+# Entailment engine used by model_check: "enumerate" checks every
+# model, "parallel" splits them among worker processes, and "sat"
+# searches for a counterexample with a SAT solver
+engine = "enumerate"
+
+# Number of complete models the enumerating engine has visited
+models = 0
+
+# Most symbols for which the enumerating engine evaluates every model
+# at once as bitsets, rather than one model at a time
+bitset_limit = 24
+
+# Whether the enumerating engine skips the models extending a partial
+# model once that decides the check
+prune = True
+
 
 class Sentence():
 
+    __slots__ = ()
+
     def evaluate(self, model):
         """Evaluates the logical sentence."""
         raise Exception("nothing to evaluate")
 
+    def partial(self, model):
+        """
+        Evaluates the logical sentence in a model that may leave
+        symbols unassigned, returning None if its value depends on them.
+        """
+        raise Exception("nothing to evaluate")
+
+    def bitset(self, columns, mask):
+        """
+        Evaluates the logical sentence in many models at once. columns
+        maps each symbol to an integer whose bit j is its value in
+        model j, and mask has a bit set for every model.
+        """
+        raise Exception("nothing to evaluate")
+
     def formula(self):
         """Returns string formula representing logical sentence."""
         return ""
@@ -44,6 +77,8 @@ class Sentence():
 
 class Symbol(Sentence):
 
+    __slots__ = ("name",)
+
     def __init__(self, name):
         self.name = name
 
@@ -62,6 +97,16 @@ class Symbol(Sentence):
         except KeyError:
             raise Exception(f"variable {self.name} not in model")
 
+    def partial(self, model):
+        value = model.get(self.name)
+        return None if value is None else bool(value)
+
+    def bitset(self, columns, mask):
+        try:
+            return columns[self.name]
+        except KeyError:
+            raise Exception(f"variable {self.name} not in model")
+
     def formula(self):
         return self.name
 
@@ -70,6 +115,9 @@ class Symbol(Sentence):
 
 
 class Not(Sentence):
+
+    __slots__ = ("operand",)
+
     def __init__(self, operand):
         Sentence.validate(operand)
         self.operand = operand
@@ -86,6 +134,13 @@ class Not(Sentence):
     def evaluate(self, model):
         return not self.operand.evaluate(model)
 
+    def partial(self, model):
+        value = self.operand.partial(model)
+        return None if value is None else not value
+
+    def bitset(self, columns, mask):
+        return mask ^ self.operand.bitset(columns, mask)
+
     def formula(self):
         return "¬" + Sentence.parenthesize(self.operand.formula())
 
@@ -94,13 +149,17 @@ class Not(Sentence):
 
 
 class And(Sentence):
+
+    __slots__ = ("conjuncts",)
+
     def __init__(self, *conjuncts):
         for conjunct in conjuncts:
             Sentence.validate(conjunct)
         self.conjuncts = list(conjuncts)
 
     def __eq__(self, other):
-        return isinstance(other, And) and self.conjuncts == other.conjuncts
+        return (isinstance(other, And)
+                and list(self.conjuncts) == list(other.conjuncts))
 
     def __hash__(self):
         return hash(
@@ -120,6 +179,24 @@ class And(Sentence):
     def evaluate(self, model):
         return all(conjunct.evaluate(model) for conjunct in self.conjuncts)
 
+    def partial(self, model):
+        result = True
+        for conjunct in self.conjuncts:
+            value = conjunct.partial(model)
+            if value is False:
+                return False
+            if value is None:
+                result = None
+        return result
+
+    def bitset(self, columns, mask):
+        result = mask
+        for conjunct in self.conjuncts:
+            result &= conjunct.bitset(columns, mask)
+            if not result:
+                break
+        return result
+
     def formula(self):
         if len(self.conjuncts) == 1:
             return self.conjuncts[0].formula()
@@ -131,13 +208,17 @@ class And(Sentence):
 
 
 class Or(Sentence):
+
+    __slots__ = ("disjuncts",)
+
     def __init__(self, *disjuncts):
         for disjunct in disjuncts:
             Sentence.validate(disjunct)
         self.disjuncts = list(disjuncts)
 
     def __eq__(self, other):
-        return isinstance(other, Or) and self.disjuncts == other.disjuncts
+        return (isinstance(other, Or)
+                and list(self.disjuncts) == list(other.disjuncts))
 
     def __hash__(self):
         return hash(
@@ -151,6 +232,24 @@ class Or(Sentence):
     def evaluate(self, model):
         return any(disjunct.evaluate(model) for disjunct in self.disjuncts)
 
+    def partial(self, model):
+        result = False
+        for disjunct in self.disjuncts:
+            value = disjunct.partial(model)
+            if value is True:
+                return True
+            if value is None:
+                result = None
+        return result
+
+    def bitset(self, columns, mask):
+        result = 0
+        for disjunct in self.disjuncts:
+            result |= disjunct.bitset(columns, mask)
+            if result == mask:
+                break
+        return result
+
     def formula(self):
         if len(self.disjuncts) == 1:
             return self.disjuncts[0].formula()
@@ -162,6 +261,9 @@ class Or(Sentence):
 
 
 class Implication(Sentence):
+
+    __slots__ = ("antecedent", "consequent")
+
     def __init__(self, antecedent, consequent):
         Sentence.validate(antecedent)
         Sentence.validate(consequent)
@@ -183,6 +285,21 @@ class Implication(Sentence):
         return ((not self.antecedent.evaluate(model))
                 or self.consequent.evaluate(model))
 
+    def partial(self, model):
+        antecedent = self.antecedent.partial(model)
+        if antecedent is False:
+            return True
+        consequent = self.consequent.partial(model)
+        if consequent is True:
+            return True
+        if antecedent is None or consequent is None:
+            return None
+        return False
+
+    def bitset(self, columns, mask):
+        return ((mask ^ self.antecedent.bitset(columns, mask))
+                | self.consequent.bitset(columns, mask))
+
     def formula(self):
         antecedent = Sentence.parenthesize(self.antecedent.formula())
         consequent = Sentence.parenthesize(self.consequent.formula())
@@ -193,6 +310,9 @@ class Implication(Sentence):
 
 
 class Biconditional(Sentence):
+
+    __slots__ = ("left", "right")
+
     def __init__(self, left, right):
         Sentence.validate(left)
         Sentence.validate(right)
@@ -216,6 +336,19 @@ class Biconditional(Sentence):
                 or (not self.left.evaluate(model)
                     and not self.right.evaluate(model)))
 
+    def partial(self, model):
+        left = self.left.partial(model)
+        if left is None:
+            return None
+        right = self.right.partial(model)
+        if right is None:
+            return None
+        return left == right
+
+    def bitset(self, columns, mask):
+        return mask ^ (self.left.bitset(columns, mask)
+                       ^ self.right.bitset(columns, mask))
+
     def formula(self):
         left = Sentence.parenthesize(str(self.left))
         right = Sentence.parenthesize(str(self.right))
@@ -227,37 +360,140 @@ class Biconditional(Sentence):
 
 def model_check(knowledge, query):
     """Checks if knowledge base entails query."""
-
-    def check_all(knowledge, query, symbols, model):
-        """Checks if knowledge base entails query, given a particular model."""
-
-        # If model has an assignment for each symbol
-        if not symbols:
-
-            # If knowledge base is true in model, then query must also be true
-            if knowledge.evaluate(model):
-                return query.evaluate(model)
-            return True
-        else:
-
-            # Choose one of the remaining unused symbols
-            remaining = symbols.copy()
-            p = remaining.pop()
-
-            # Create a model where the symbol is true
-            model_true = model.copy()
-            model_true[p] = True
-
-            # Create a model where the symbol is false
-            model_false = model.copy()
-            model_false[p] = False
-
-            # Ensure entailment holds in both models
-            return (check_all(knowledge, query, remaining, model_true) and
-                    check_all(knowledge, query, remaining, model_false))
+    global models
+
+    # Imported here, since sat and parallel import this module
+    if engine == "sat":
+        import sat
+        return sat.model_check(knowledge, query)
+    if engine == "parallel":
+        import parallel
+        return parallel.model_check(knowledge, query)
+    if engine != "enumerate":
+        raise ValueError(f"unknown engine {engine}")
 
     # Get all symbols in both knowledge and query
-    symbols = set.union(knowledge.symbols(), query.symbols())
+    symbols = sorted(set.union(knowledge.symbols(), query.symbols()))
+
+    # Check every model at once if there are few enough of them
+    if len(symbols) <= bitset_limit:
+        models += 1 << len(symbols)
+        columns, mask = truth_table(symbols)
+        return not (knowledge.bitset(columns, mask)
+                    & ~query.bitset(columns, mask))
 
     # Check that knowledge entails query
     return check_all(knowledge, query, symbols, dict())
+
+
+def check_all(knowledge, query, symbols, model):
+    """
+    Checks if knowledge base entails query, given a particular model,
+    for every assignment of the symbols. Assigns the symbols in model
+    and pops them off the symbols list while checking, restoring
+    both before returning.
+    """
+    global models
+
+    # If model has an assignment for each symbol
+    if not symbols:
+        models += 1
+
+        # If knowledge base is true in model, then query must also be true
+        if knowledge.evaluate(model):
+            return query.evaluate(model)
+        return True
+
+    # Stop early once the partial model decides every extension
+    if prune:
+        known = knowledge.partial(model)
+        if known is False:
+            return True
+        entailed = query.partial(model)
+        if entailed is True:
+            return True
+        if known is True and entailed is False:
+            return False
+
+    # Choose one of the remaining unused symbols
+    p = symbols.pop()
+    try:
+
+        # Ensure entailment holds where the symbol is true and false
+        model[p] = True
+        if not check_all(knowledge, query, symbols, model):
+            return False
+        model[p] = False
+        return check_all(knowledge, query, symbols, model)
+    finally:
+        del model[p]
+        symbols.append(p)
+
+
+def truth_table(symbols):
+    """
+    Returns the columns of a truth table over symbols, as a dict
+    mapping each symbol to a bitset whose bit j is its value in model
+    j, and the mask of all 2 ** len(symbols) models.
+    """
+    size = 1 << len(symbols)
+    columns = {}
+    for i, symbol in enumerate(symbols):
+
+        # Runs of 2 ** i false models then 2 ** i true models,
+        # doubled until the column covers every model
+        width = 2 << i
+        column = ((1 << (width // 2)) - 1) << (width // 2)
+        while width < size:
+            column |= column << width
+            width *= 2
+        columns[symbol] = column
+    return columns, (1 << size) - 1
+
+
+def model_check_all(knowledge, queries):
+    """
+    Checks which of queries the knowledge base entails,
+    returning a list of booleans in the same order.
+    """
+    global models
+
+    # Imported here, since sat imports this module
+    if engine == "sat":
+        import sat
+        return sat.model_check_all(knowledge, queries)
+    if engine == "parallel":
+        return [model_check(knowledge, query) for query in queries]
+    if engine != "enumerate":
+        raise ValueError(f"unknown engine {engine}")
+
+    # Queries mentioning symbols the knowledge base does not are
+    # checked on their own, over their own extra symbols
+    symbols = knowledge.symbols()
+    entailed = [None] * len(queries)
+    for i, query in enumerate(queries):
+        if not query.symbols() <= symbols:
+            entailed[i] = model_check(knowledge, query)
+
+    # Enumerate the models of the knowledge base's symbols once,
+    # ruling out every query that is false in one of them
+    symbols = sorted(symbols)
+    pending = [i for i in range(len(queries)) if entailed[i] is None]
+    if len(symbols) <= bitset_limit:
+        models += 1 << len(symbols)
+        columns, mask = truth_table(symbols)
+        known = knowledge.bitset(columns, mask)
+        for i in pending:
+            entailed[i] = not known & ~queries[i].bitset(columns, mask)
+        return entailed
+    for values in itertools.product((True, False), repeat=len(symbols)):
+        if not pending:
+            break
+        models += 1
+        model = dict(zip(symbols, values))
+        if knowledge.evaluate(model):
+            pending = [i for i in pending if queries[i].evaluate(model)]
+    for i in range(len(queries)):
+        if entailed[i] is None:
+            entailed[i] = i in pending
+    return entailed
@@ -0,0 +1,65 @@
+import itertools
+import os
+from multiprocessing import Pool
+
+import logic
+
+# Knowledge base and query being checked, in each worker process
+knowledge = None
+query = None
+
+
+def init_worker(worker_knowledge, worker_query):
+    """Receives the knowledge base and query once per worker."""
+    global knowledge, query
+    knowledge = worker_knowledge
+    query = worker_query
+
+
+def check_chunk(free, fixed):
+    """
+    Checks if knowledge base entails query in every model that
+    extends the fixed assignment with values for the free symbols.
+    """
+    if len(free) <= logic.bitset_limit:
+        columns, mask = logic.truth_table(free)
+        for symbol, value in fixed.items():
+            columns[symbol] = mask if value else 0
+        return not (knowledge.bitset(columns, mask)
+                    & ~query.bitset(columns, mask))
+    return logic.check_all(knowledge, query, list(free), dict(fixed))
+
+
+def model_check(knowledge, query, workers=None, split=None):
+    """
+    Checks if knowledge base entails query, with the models split
+    into 2 ** split chunks by fixing the first split symbols, checked
+    by a pool of worker processes. Stops every worker as soon as one
+    chunk has a counterexample.
+    """
+    symbols = sorted(set.union(knowledge.symbols(), query.symbols()))
+    if workers is None:
+        workers = os.cpu_count()
+    if split is None:
+
+        # About four chunks per worker, to even out their loads, and
+        # small enough chunks to evaluate as bitsets
+        split = max((4 * workers - 1).bit_length(),
+                    len(symbols) - logic.bitset_limit)
+    split = min(split, len(symbols))
+    fixed, free = symbols[:split], symbols[split:]
+
+    chunks = [(free, dict(zip(fixed, values))) for values in
+              itertools.product((True, False), repeat=len(fixed))]
+    with Pool(workers, initializer=init_worker,
+              initargs=(knowledge, query)) as pool:
+        for entailed in pool.imap_unordered(check, chunks):
+            if not entailed:
+                pool.terminate()
+                return False
+    return True
+
+
+def check(chunk):
+    """Checks one (free symbols, fixed assignment) chunk."""
+    return check_chunk(*chunk)
@@ -0,0 +1,405 @@
+import heapq
+
+from cnf import CNF
+from logic import And
+
+# Number of calls to Solver.solve
+solves = 0
+
+
+class Solver():
+    """
+    CDCL satisfiability solver over the clauses of a CNF.
+
+    Propagates units through two watched literals per clause, learns
+    a first-UIP clause from every conflict and backjumps to the level
+    where it becomes unit. Clauses added to the CNF after a solve are
+    picked up by the next one, keeping learned clauses.
+    """
+
+    def __init__(self, cnf):
+        self.cnf = cnf
+
+        # Number of CNF clauses added to the solver so far
+        self.synced = 0
+
+        # Clauses as lists of literals, the first two being watched
+        self.clauses = []
+
+        # Clauses watching each literal, indexed by literal
+        self.watches = {}
+
+        # Number of added (not learned) clauses containing each literal
+        self.occurrences = {}
+
+        # Assignment: 1, -1 or 0 per variable, with its decision
+        # level and the clause that implied it (None for decisions)
+        self.assignment = [0]
+        self.level = [0]
+        self.reason = [None]
+
+        # Assigned literals in order, and where each level starts
+        self.trail = []
+        self.levels = []
+        self.propagated = 0
+
+        # Branching activity per variable and preferred polarity
+        self.activity = [0.0]
+        self.bump = 1.0
+        self.heap = []
+        self.phase = [False]
+
+        # False once the clauses are unsatisfiable without assumptions
+        self.consistent = True
+
+        # Satisfying assignment of the last successful solve
+        self.model = None
+
+        self.decisions = 0
+        self.conflicts = 0
+        self.propagations = 0
+
+    def grow(self):
+        """Makes room for every variable of the CNF."""
+        for v in range(len(self.assignment), self.cnf.count + 1):
+            self.assignment.append(0)
+            self.level.append(0)
+            self.reason.append(None)
+            self.activity.append(0.0)
+            self.phase.append(False)
+            self.watches[v] = []
+            self.watches[-v] = []
+            self.occurrences[v] = 0
+            self.occurrences[-v] = 0
+            heapq.heappush(self.heap, (0.0, v))
+
+    def sync(self):
+        """Adds the clauses the CNF gained since the last sync."""
+        self.grow()
+        clauses = self.cnf.clauses[self.synced:]
+        self.synced = len(self.cnf.clauses)
+        if not clauses:
+            return
+        self.backtrack(0)
+        for clause in clauses:
+            self.add_clause(clause)
+
+    def value(self, literal):
+        """Returns 1 if literal is true, -1 if false, 0 if unassigned."""
+        value = self.assignment[abs(literal)]
+        return value if literal > 0 else -value
+
+    def add_clause(self, clause):
+        """Adds a clause at decision level 0."""
+        if not self.consistent:
+            return
+        literals = []
+        for literal in clause:
+            if -literal in literals or self.value(literal) == 1:
+                return
+            if literal not in literals and self.value(literal) == 0:
+                literals.append(literal)
+        if not literals:
+            self.consistent = False
+        elif len(literals) == 1:
+            self.assign(literals[0], None)
+            if self.propagate() is not None:
+                self.consistent = False
+        else:
+            self.watch(literals)
+            for literal in literals:
+                self.occurrences[literal] += 1
+
+    def watch(self, literals):
+        """Stores a clause and watches its first two literals."""
+        self.clauses.append(literals)
+        i = len(self.clauses) - 1
+        self.watches[literals[0]].append(i)
+        self.watches[literals[1]].append(i)
+        return i
+
+    def assign(self, literal, reason):
+        """Makes literal true at the current decision level."""
+        v = abs(literal)
+        self.assignment[v] = 1 if literal > 0 else -1
+        self.level[v] = len(self.levels)
+        self.reason[v] = reason
+        self.trail.append(literal)
+
+    def propagate(self):
+        """
+        Assigns every literal forced by unit clauses.
+        Returns the index of a falsified clause, or None.
+        """
+        while self.propagated < len(self.trail):
+            false = -self.trail[self.propagated]
+            self.propagated += 1
+            self.propagations += 1
+            watchers = self.watches[false]
+            kept = []
+            for n, i in enumerate(watchers):
+                clause = self.clauses[i]
+                if clause[0] == false:
+                    clause[0], clause[1] = clause[1], false
+                if self.value(clause[0]) == 1:
+                    kept.append(i)
+                    continue
+
+                # Move the watch to another literal that is not false
+                for k in range(2, len(clause)):
+                    if self.value(clause[k]) != -1:
+                        clause[1], clause[k] = clause[k], false
+                        self.watches[clause[1]].append(i)
+                        break
+                else:
+                    kept.append(i)
+                    if self.value(clause[0]) == -1:
+                        self.watches[false] = kept + watchers[n + 1:]
+                        return i
+                    self.assign(clause[0], i)
+            self.watches[false] = kept
+        return None
+
+    def analyze(self, conflict):
+        """
+        Returns a learned clause implied by the conflict, whose first
+        literal is the only one at the current level, and the level
+        to backjump to.
+        """
+        current = len(self.levels)
+        seen = set()
+        learned = [None]
+        pending = 0
+        literal = None
+        index = len(self.trail) - 1
+        clause = self.clauses[conflict]
+        while True:
+            for q in clause:
+                v = abs(q)
+                if q == literal or v in seen or self.level[v] == 0:
+                    continue
+                seen.add(v)
+                self.increase(v)
+                if self.level[v] == current:
+                    pending += 1
+                else:
+                    learned.append(q)
+
+            # Resolve on the most recent literal of the current level
+            while abs(self.trail[index]) not in seen:
+                index -= 1
+            literal = self.trail[index]
+            index -= 1
+            pending -= 1
+            if pending == 0:
+                break
+            clause = self.clauses[self.reason[abs(literal)]]
+        learned[0] = -literal
+
+        # Watch the literal at the highest remaining level second
+        back = 0
+        for k in range(1, len(learned)):
+            if self.level[abs(learned[k])] > back:
+                back = self.level[abs(learned[k])]
+                learned[1], learned[k] = learned[k], learned[1]
+        self.bump *= 1.05
+        return learned, back
+
+    def increase(self, v):
+        """Raises the branching activity of variable v."""
+        self.activity[v] += self.bump
+        if self.activity[v] > 1e100:
+            self.activity = [activity * 1e-100 for activity in self.activity]
+            self.bump *= 1e-100
+            self.heap = [(-self.activity[u], u)
+                         for u in range(1, len(self.activity))]
+            heapq.heapify(self.heap)
+        heapq.heappush(self.heap, (-self.activity[v], v))
+
+    def backtrack(self, level):
+        """Undoes every assignment above decision level."""
+        if len(self.levels) <= level:
+            return
+        for literal in self.trail[self.levels[level]:]:
+            v = abs(literal)
+            self.phase[v] = literal > 0
+            self.assignment[v] = 0
+            self.reason[v] = None
+            heapq.heappush(self.heap, (-self.activity[v], v))
+        del self.trail[self.levels[level]:]
+        del self.levels[level:]
+        self.propagated = len(self.trail)
+
+    def decide(self, literal):
+        """Opens a new decision level, assigning literal if given."""
+        self.levels.append(len(self.trail))
+        if literal is not None:
+            self.decisions += 1
+            self.assign(literal, None)
+
+    def unassigned(self):
+        """Returns the most active unassigned variable, or None."""
+        while self.heap:
+            activity, v = heapq.heappop(self.heap)
+            if self.assignment[v] == 0 and -activity == self.activity[v]:
+                return v
+        return None
+
+    def pure_literals(self):
+        """
+        Returns unassigned literals whose negation occurs in no
+        clause that was added.
+        """
+        pure = []
+        for v in range(1, len(self.assignment)):
+            if self.assignment[v] == 0:
+                positive = self.occurrences[v]
+                negative = self.occurrences[-v]
+                if positive and not negative:
+                    pure.append(v)
+                elif negative and not positive:
+                    pure.append(-v)
+        return pure
+
+    def solve(self, assumptions=()):
+        """
+        Checks whether the clauses are satisfiable with every literal
+        in assumptions true. On success, stores the assignment in
+        model, mapping variables to booleans.
+        """
+        global solves
+        solves += 1
+
+        self.sync()
+        self.backtrack(0)
+        self.model = None
+        if not self.consistent:
+            return False
+        if self.propagate() is not None:
+            self.consistent = False
+            return False
+
+        # Pure literals can be set without losing any solution,
+        # so they are decided right after the assumptions
+        assumptions = list(assumptions)
+        pure = self.pure_literals()
+
+        while True:
+            conflict = self.propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                if not self.levels:
+                    self.consistent = False
+                    return False
+                learned, back = self.analyze(conflict)
+                self.backtrack(back)
+                if len(learned) == 1:
+                    self.assign(learned[0], None)
+                else:
+                    self.assign(learned[0], self.watch(learned))
+                continue
+
+            if len(self.levels) < len(assumptions):
+                literal = assumptions[len(self.levels)]
+                if self.value(literal) == -1:
+                    return False
+                self.decide(literal if self.value(literal) == 0 else None)
+                continue
+
+            while pure and self.value(pure[-1]) != 0:
+                pure.pop()
+            if pure:
+                self.decide(pure.pop())
+                continue
+
+            v = self.unassigned()
+            if v is None:
+                self.model = {v: self.assignment[v] == 1
+                              for v in range(1, len(self.assignment))}
+                return True
+            self.decide(v if self.phase[v] else -v)
+
+
+class KnowledgeBase():
+    """
+    A knowledge base that is told sentences over time and asked what
+    they entail. Its clauses and solver, with every clause learned so
+    far, are kept between calls, so each tell compiles only the new
+    sentence and each ask starts from what earlier ones learned.
+    """
+
+    def __init__(self, knowledge=None):
+        """
+        Starts from knowledge, if given. If it is an And, conjuncts
+        later added to it with And.add are told before the next ask.
+        """
+        self.cnf = CNF()
+        self.solver = Solver(self.cnf)
+        self.conjunction = None
+        self.followed = 0
+        if isinstance(knowledge, And):
+            self.conjunction = knowledge
+            self.follow()
+        elif knowledge is not None:
+            self.tell(knowledge)
+
+    def follow(self):
+        """Tells the conjuncts added to the followed And since last time."""
+        if self.conjunction is None:
+            return
+        conjuncts = self.conjunction.conjuncts
+        for conjunct in conjuncts[self.followed:]:
+            self.tell(conjunct)
+        self.followed = len(conjuncts)
+
+    def tell(self, sentence):
+        """Adds a sentence to the knowledge base."""
+        self.cnf.add(sentence)
+
+    def consistent(self):
+        """Checks whether the sentences told so far are satisfiable."""
+        self.follow()
+        return self.solver.solve()
+
+    def ask(self, query):
+        """Checks if the knowledge base entails query."""
+        self.follow()
+        return not self.solver.solve([-self.cnf.literal(query)])
+
+    def ask_all(self, queries):
+        """
+        Checks which of queries the knowledge base entails. Each
+        counterexample found rules out every query false in it, so a
+        query needs its own solve only if it is entailed or survives
+        all earlier counterexamples.
+        """
+        self.follow()
+        literals = [self.cnf.literal(query) for query in queries]
+        entailed = [None] * len(queries)
+        for i, literal in enumerate(literals):
+            if entailed[i] is not None:
+                continue
+            if not self.solver.solve([-literal]):
+                entailed[i] = True
+                continue
+            model = self.solver.model
+            for j in range(i, len(queries)):
+                q = literals[j]
+                if entailed[j] is None and model[abs(q)] != (q > 0):
+                    entailed[j] = False
+        return entailed
+
+
+def model_check(knowledge, query):
+    """
+    Checks if knowledge base entails query, by showing that the
+    knowledge base and the query's negation are unsatisfiable.
+    """
+    compiled = CNF(knowledge)
+    q = compiled.literal(query)
+    return not Solver(compiled).solve([-q])
+
+
+def model_check_all(knowledge, queries):
+    """Checks which of queries the knowledge base entails."""
+    return KnowledgeBase(knowledge).ask_all(queries)
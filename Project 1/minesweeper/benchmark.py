@@ -0,0 +1,146 @@
+import contextlib
+import io
+import random
+import signal
+import sys
+import time
+
+from minesweeper import BitMinesweeperAI, Minesweeper, MinesweeperAI
+
+# Board sizes to play on, with one mine in every eight cells
+SIZES = [8, 16, 32, 64, 100, 150]
+
+
+class GameTimeout(Exception):
+    pass
+
+
+def timeout(signum, frame):
+    raise GameTimeout()
+
+
+def play(ai_class, size, seed, check=False, limit=None):
+    """
+    Plays one game on a size by size board with the given AI, and
+    returns (won, moves, seconds). If check is true, also checks
+    after every move that the cells the AI knows are correct. If
+    the game takes longer than limit seconds, it is stopped there,
+    with won None.
+    """
+    random.seed(seed)
+    game = Minesweeper(height=size, width=size, mines=size * size // 8)
+    ai = ai_class(height=size, width=size)
+    safe_cells = size * size - len(game.mines)
+
+    moves = 0
+    won = False
+    if limit is not None:
+        signal.signal(signal.SIGALRM, timeout)
+        signal.setitimer(signal.ITIMER_REAL, limit)
+    start = time.perf_counter()
+    try:
+        while True:
+
+            # MinesweeperAI prints its random moves
+            with contextlib.redirect_stdout(io.StringIO()):
+                move = ai.make_safe_move()
+                if move is None:
+                    move = ai.make_random_move()
+            if move is None or game.is_mine(move):
+                break
+            ai.add_knowledge(move, game.nearby_mines(move))
+            moves += 1
+
+            if check:
+                check_start = time.perf_counter()
+                if not ai.mines <= game.mines or ai.safes & game.mines:
+                    raise Exception(f"wrong knowledge after move {move}")
+                start += time.perf_counter() - check_start
+            if moves == safe_cells:
+                won = True
+                break
+    except GameTimeout:
+        won = None
+    finally:
+        if limit is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    return won, moves, time.perf_counter() - start
+
+
+def benchmark_bitmask():
+    """
+    Compares the time per move of MinesweeperAI with BitMinesweeperAI
+    on the same boards. MinesweeperAI games are stopped after a time
+    limit, and not counted, and it is left out of larger boards once
+    it has used up its time budget.
+    """
+    print(f"{'board':>9}{'games':>7}{'bits won':>10}{'sets ms/move':>14}"
+          f"{'timeouts':>10}{'bits ms/move':>14}{'speedup':>9}")
+    budget = 60
+    for size in SIZES:
+        games = max(1, 400 // size)
+        results = {}
+        for ai_class in (MinesweeperAI, BitMinesweeperAI):
+            if ai_class is MinesweeperAI and budget <= 0:
+                continue
+            limit = 10 if ai_class is MinesweeperAI else None
+            results[ai_class] = [
+                play(ai_class, size, seed, limit=limit)
+                for seed in range(games)
+            ]
+            if ai_class is MinesweeperAI:
+                budget -= sum(seconds for _, _, seconds in
+                              results[ai_class])
+
+        # Milliseconds per move over the games that finished
+        times = {}
+        for ai_class, played in results.items():
+            finished = [game for game in played if game[0] is not None]
+            moves = sum(moves for _, moves, _ in finished)
+            seconds = sum(seconds for _, _, seconds in finished)
+            times[ai_class] = 1000 * seconds / max(moves, 1)
+
+        bits = times[BitMinesweeperAI]
+        wins = sum(won for won, _, _ in results[BitMinesweeperAI])
+        sets = timeouts = speedup = ""
+        if MinesweeperAI in times:
+            sets = f"{times[MinesweeperAI]:.3f}"
+            timeouts = sum(won is None for won, _, _ in
+                           results[MinesweeperAI])
+            speedup = f"{times[MinesweeperAI] / bits:.1f}x"
+        print(f"{f'{size}x{size}':>9}{games:>7}{wins:>10}{sets:>14}"
+              f"{timeouts:>10}{bits:>14.3f}{speedup:>9}")
+
+
+def verify():
+    """
+    Checks that BitMinesweeperAI only ever knows correct mines and
+    safes, and compares how many 8x8 games each AI wins.
+    """
+    games = 0
+    for size in SIZES[:4]:
+        for seed in range(200 // size):
+            play(BitMinesweeperAI, size, seed, check=True)
+            games += 1
+    print(f"BitMinesweeperAI knowledge is correct in {games} games.")
+
+    wins = {MinesweeperAI: 0, BitMinesweeperAI: 0}
+    for ai_class in wins:
+        for seed in range(200):
+            wins[ai_class] += play(ai_class, 8, seed)[0]
+    print(f"Won {wins[MinesweeperAI]} of 200 8x8 games with sets, "
+          f"{wins[BitMinesweeperAI]} with bitmasks.")
+
+
+def main():
+    commands = ("bitmask", "verify")
+    if len(sys.argv) != 2 or sys.argv[1] not in commands:
+        sys.exit(f"Usage: python benchmark.py {'|'.join(commands)}")
+    if sys.argv[1] == "bitmask":
+        benchmark_bitmask()
+    elif sys.argv[1] == "verify":
+        verify()
+
+
+if __name__ == "__main__":
+    main()
@@ -160,8 +160,8 @@ class MinesweeperAI():
 
         # All available moves
         self.all_moves = set()
-        for i in range(width):
-            for j in range(height):
+        for i in range(height):
+            for j in range(width):
                 self.all_moves.add((i, j))
 
     def mark_mine(self, cell):
@@ -269,7 +269,7 @@ class MinesweeperAI():
         neighbor_cells = set()
         for x in range(i-1, i+2):
             for y in range(j-1, j+2):
-                if x >= 0 and x <= 7 and y >= 0 and y <= 7:
+                if 0 <= x < self.height and 0 <= y < self.width:
                     neighbor_cells.add((x, y))
         return neighbor_cells
 
@@ -277,3 +277,279 @@ class MinesweeperAI():
         cells = sentence_B.cells - sentence_A.cells - self.moves_made
         count = sentence_B.count - sentence_A.count
         return Sentence(cells, count)
+
+
+class BitSentence():
+    """
+    Logical statement about a Minesweeper game, like Sentence,
+    but with its cells packed into an integer bitmask:
+    cell (i, j) is bit i * width + j.
+    """
+
+    def __init__(self, cells, count):
+        self.cells = cells
+        self.count = count
+
+    def __eq__(self, other):
+        return self.cells == other.cells and self.count == other.count
+
+    def __str__(self):
+        return f"{bin(self.cells)} = {self.count}"
+
+    def known_mines(self):
+        """
+        Returns the mask of all cells in self.cells known to be mines.
+        """
+        if self.count == self.cells.bit_count():
+            return self.cells
+        else:
+            return 0
+
+    def known_safes(self):
+        """
+        Returns the mask of all cells in self.cells known to be safe.
+        """
+        if self.count == 0:
+            return self.cells
+        else:
+            return 0
+
+    def mark_mine(self, mask):
+        """
+        Updates internal knowledge representation given the fact that
+        the cells in mask are known to be mines.
+        """
+        mines = self.cells & mask
+        self.cells ^= mines
+        self.count -= mines.bit_count()
+
+    def mark_safe(self, mask):
+        """
+        Updates internal knowledge representation given the fact that
+        the cells in mask are known to be safe.
+        """
+        self.cells &= ~mask
+
+
+class BitMinesweeperAI():
+    """
+    Minesweeper game player with the same interface as MinesweeperAI,
+    keeping its knowledge as BitSentences, so that subset tests,
+    differences and marking cells are single integer operations.
+
+    Inference is incremental: only sentences that are new or have
+    changed are compared, and only with the sentences that share a
+    cell with them, found through an index from cells to sentences.
+    """
+
+    def __init__(self, height=8, width=8):
+
+        # Set initial height and width
+        self.height = height
+        self.width = width
+
+        # Masks of cells clicked on, and known to be safe or mines
+        self.moves_mask = 0
+        self.mines_mask = 0
+        self.safes_mask = 0
+
+        # Sentences about the game known to be true, keyed by cells
+        self.knowledge = {}
+
+        # Sentences that may contain each cell, checked when used
+        self.containing = [[] for _ in range(height * width)]
+
+        # Sentences that are new or changed, still to be inferred from
+        self.pending = []
+
+        # Mask of each cell's neighbors, not including the cell itself
+        self.neighbor_masks = []
+        for i in range(height):
+            for j in range(width):
+                mask = 0
+                for x in range(max(i - 1, 0), min(i + 2, height)):
+                    for y in range(max(j - 1, 0), min(j + 2, width)):
+                        mask |= 1 << (x * width + y)
+                self.neighbor_masks.append(mask & ~self.bit((i, j)))
+
+    @property
+    def moves_made(self):
+        return self.cells(self.moves_mask)
+
+    @property
+    def mines(self):
+        return self.cells(self.mines_mask)
+
+    @property
+    def safes(self):
+        return self.cells(self.safes_mask)
+
+    def bit(self, cell):
+        """
+        Returns the mask with only cell in it.
+        """
+        i, j = cell
+        return 1 << (i * self.width + j)
+
+    def cells(self, mask):
+        """
+        Returns the set of cells in mask.
+        """
+        cells = set()
+        for index in indices(mask):
+            cells.add(divmod(index, self.width))
+        return cells
+
+    def mark_mine(self, cell):
+        """
+        Marks a cell as a mine, and updates all knowledge
+        to mark that cell as a mine as well.
+        """
+        self.mark_mines(self.bit(cell))
+
+    def mark_safe(self, cell):
+        """
+        Marks a cell as safe, and updates all knowledge
+        to mark that cell as safe as well.
+        """
+        self.mark_safes(self.bit(cell))
+
+    def mark_mines(self, mask):
+        """
+        Marks the cells in mask as mines, updating the sentences
+        that contain them and queueing those for inference.
+        """
+        mask &= ~self.mines_mask
+        if not mask:
+            return
+        self.mines_mask |= mask
+        for sentence in self.overlapping(mask):
+            del self.knowledge[sentence.cells]
+            sentence.mark_mine(mask)
+            self.pending.append(sentence)
+
+    def mark_safes(self, mask):
+        """
+        Marks the cells in mask as safe, updating the sentences
+        that contain them and queueing those for inference.
+        """
+        mask &= ~self.safes_mask
+        if not mask:
+            return
+        self.safes_mask |= mask
+        for sentence in self.overlapping(mask):
+            del self.knowledge[sentence.cells]
+            sentence.mark_safe(mask)
+            self.pending.append(sentence)
+
+    def overlapping(self, mask):
+        """
+        Returns the sentences in the knowledge base that share
+        a cell with mask, dropping stale entries from the index.
+        """
+        found = {}
+        for index in indices(mask):
+            live = []
+            for sentence in self.containing[index]:
+                if (self.knowledge.get(sentence.cells) is sentence
+                        and sentence.cells >> index & 1):
+                    live.append(sentence)
+                    found[id(sentence)] = sentence
+            self.containing[index] = live
+        return list(found.values())
+
+    def add_knowledge(self, cell, count):
+        """
+        Called when the Minesweeper board tells us, for a given
+        safe cell, how many neighboring cells have mines in them.
+        Marks the cell as a move that has been made and as safe,
+        adds a sentence about its neighbors, and draws every
+        conclusion that follows from the new and changed sentences.
+        """
+        bit = self.bit(cell)
+        self.moves_mask |= bit
+        self.mark_safes(bit)
+        self.pending.append(BitSentence(
+            self.neighbor_masks[bit.bit_length() - 1], count
+        ))
+        self.infer()
+
+    def infer(self):
+        """
+        Adds the pending sentences to the knowledge base, marking
+        cells they determine and inferring new sentences from
+        the ones they are a subset or superset of.
+        """
+        while self.pending:
+            sentence = self.pending.pop()
+
+            # Bring the sentence up to date with known cells
+            sentence.mark_mine(self.mines_mask)
+            sentence.mark_safe(self.safes_mask)
+            if not sentence.cells or sentence.cells in self.knowledge:
+                continue
+            if sentence.known_safes():
+                self.mark_safes(sentence.cells)
+                continue
+            if sentence.known_mines():
+                self.mark_mines(sentence.cells)
+                continue
+
+            # If one sentence's cells are a subset of another's, the
+            # difference has the difference of their counts of mines
+            for other in self.overlapping(sentence.cells):
+                if other.cells & ~sentence.cells == 0:
+                    self.pending.append(BitSentence(
+                        sentence.cells & ~other.cells,
+                        sentence.count - other.count
+                    ))
+                elif sentence.cells & ~other.cells == 0:
+                    self.pending.append(BitSentence(
+                        other.cells & ~sentence.cells,
+                        other.count - sentence.count
+                    ))
+
+            self.knowledge[sentence.cells] = sentence
+            for index in indices(sentence.cells):
+                self.containing[index].append(sentence)
+
+    def make_safe_move(self):
+        """
+        Returns a safe cell to choose on the Minesweeper board.
+        The move must be known to be safe, and not already a move
+        that has been made. Chooses the lowest such cell, rather than
+        a random one, so as not to list every safe cell on each move.
+        """
+        choice = self.safes_mask & ~self.moves_mask & ~self.mines_mask
+        if choice:
+            return divmod((choice & -choice).bit_length() - 1, self.width)
+
+    def make_random_move(self):
+        """
+        Returns a move to make on the Minesweeper board.
+        Should choose randomly among cells that:
+            1) have not already been chosen, and
+            2) are not known to be mines
+        """
+        size = self.height * self.width
+        choice = ((1 << size) - 1) & ~self.moves_mask & ~self.mines_mask
+        if not choice:
+            return None
+
+        # Try random cells first, to avoid listing every cell on a
+        # large board, before choosing among the cells left
+        for _ in range(32):
+            index = random.randrange(size)
+            if choice >> index & 1:
+                return divmod(index, self.width)
+        return random.choice(list(self.cells(choice)))
+
+
+def indices(mask):
+    """
+    Yields the index of each bit set in mask, lowest first.
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low